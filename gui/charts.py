@@ -1,6 +1,20 @@
 # draft_wheel/gui/charts.py
 
 import tkinter as tk
+import tkinter.font as tkfont
+from bisect import bisect_right
+
+# Role groups used to categorize players by their top two roles
+from logic.draft_logic import CORE_ROLES, SUPPORT_ROLES
+
+
+def _font_family_size(font):
+    """(family, size) of a font given as a tuple or a tkinter.font.Font"""
+    if isinstance(font, tkfont.Font):
+        return font.cget("family"), font.cget("size")
+    return font[0], font[1]
+
+
 class MMRBucketChartView:
     """
     A separate chart class for MMR bucket distribution with improved visuals.
@@ -12,6 +26,10 @@ class MMRBucketChartView:
         self.bg = bg
         self.text_font = text_font
         self.parent = parent
+        # Derived label fonts, resolved once from the base font
+        family, size = _font_family_size(text_font)
+        self.bold_font = (family, size, "bold")
+        self.heading_font = (family, size + 1, "bold")
 
         self.canvas = tk.Canvas(parent, width=width, height=height, bg=bg, highlightthickness=1, highlightbackground="#3D4663")
         self.canvas.pack(side=tk.BOTTOM, padx=10, pady=5, fill=tk.BOTH, expand=True)
@@ -32,6 +50,10 @@ class MMRBucketChartView:
         self.current_stats = None
         self.current_all_players = None
         self.current_logic = None
+        
+        # While suspended (e.g. covered by the banner) draws are deferred
+        self.suspended = False
+        self._chart_dirty = False
 
     def _on_resize(self, event):
         """Handle window resize event"""
@@ -43,12 +65,24 @@ class MMRBucketChartView:
         if self.current_stats:
             self.draw(self.current_stats, self.current_all_players, self.current_logic)
 
+    def set_suspended(self, suspended):
+        """Suspend or resume drawing; resuming redraws if an update was deferred"""
+        self.suspended = suspended
+        if not suspended and self._chart_dirty:
+            self._chart_dirty = False
+            if self.current_stats:
+                self.draw(self.current_stats, self.current_all_players, self.current_logic)
+
     def draw(self, stats: dict, all_players=None, logic=None):
         # Store current data for resize events
         self.current_stats = stats
         self.current_all_players = all_players
         self.current_logic = logic
         
+        if self.suspended:
+            self._chart_dirty = True
+            return
+        
         self.canvas.delete("all")
         if not stats or not logic or not all_players:
             # Fall back to original drawing if we don't have logic or player data
@@ -90,7 +124,7 @@ class MMRBucketChartView:
                 fill="#3D4663", width=1, dash=(2, 4)
             )
 
-        buckets_list = list(recategorized_stats.keys())
+        buckets_list = list(recategorized_stats)
         for i, bucket_key in enumerate(buckets_list):
             x_start = left_margin + i * (3 * bar_width + gap)
             bdata = recategorized_stats[bucket_key]
@@ -156,7 +190,7 @@ class MMRBucketChartView:
             # label - with slight glow effect
             self.canvas.create_text(
                 x_start + 1.5 * bar_width, base_line + 15, text=bucket_key,
-                font=(self.text_font[0], self.text_font[1], "bold"), fill="#FFFFFF"
+                font=self.bold_font, fill="#FFFFFF"
             )
 
         # Draw legend with more spacing and clearer separation from chart
@@ -214,23 +248,23 @@ class MMRBucketChartView:
         
         # Create new stats dictionary based on custom bucket ranges
         new_stats = {}
-        for bucket in bucket_ranges.keys():
+        for bucket in bucket_ranges:
             new_stats[bucket] = {
                 "core_only": 0,
                 "support_only": 0,
                 "mixed": 0
             }
         
+        # Bucket lower bounds sorted once so each player is placed with a bisect
+        sorted_buckets = sorted(bucket_ranges.items(), key=lambda kv: kv[1][0])
+        bucket_mins = [min_val for _, (min_val, _) in sorted_buckets]
+        
         # Get already drafted players
         drafted_players = set()
         for team_data in logic.teams.values():
             for player, _ in team_data["players"]:
                 drafted_players.add(player)
                 
-        # Define core and support roles
-        core_roles = {"carry", "mid", "offlane"}
-        support_roles = {"soft_support", "hard_support"}
-        
         # Debug info
         print("Categorizing players by MMR buckets...")
         
@@ -240,32 +274,29 @@ class MMRBucketChartView:
             if player_name in drafted_players:
                 continue
                 
-            mmr = player_data["mmr"]
-            roles = player_data["roles"]
+            mmr = player_data.mmr
             
             # Find the bucket for this player's MMR using explicit ranges
             player_bucket = None
-            for bucket, (min_val, max_val) in bucket_ranges.items():
-                if min_val <= mmr <= max_val:
+            pos = bisect_right(bucket_mins, mmr) - 1
+            if pos >= 0:
+                bucket, (_, max_val) = sorted_buckets[pos]
+                if mmr <= max_val:
                     player_bucket = bucket
-                    break
                     
             if not player_bucket:
                 print(f"Warning: Player {player_name} with MMR {mmr} doesn't fit any bucket")
                 continue  # Skip if no bucket matches
                 
-            # Look at first two priority roles (if available)
-            top_roles = sorted(roles, key=lambda x: x[1])[:2]
+            # Look at first two priority roles (if available), precomputed per player
+            top_roles = player_data.top_roles
             if not top_roles:
                 new_stats[player_bucket]["mixed"] += 1
                 continue
                 
-            # Get role types
-            role_types = [role_name for role_name, _ in top_roles]
-            
             # Categorize based on role types
-            is_core = all(role in core_roles for role in role_types)
-            is_support = all(role in support_roles for role in role_types)
+            is_core = top_roles <= CORE_ROLES
+            is_support = top_roles <= SUPPORT_ROLES
             
             if is_core:
                 new_stats[player_bucket]["core_only"] += 1
@@ -312,7 +343,7 @@ class MMRBucketChartView:
                 fill="#3D4663", width=1, dash=(2, 4)
             )
 
-        buckets_list = list(stats.keys())
+        buckets_list = list(stats)
         for i, bucket_key in enumerate(buckets_list):
             x_start = left_margin + i * (3 * bar_width + gap)
             bdata = stats[bucket_key]
@@ -377,7 +408,7 @@ class MMRBucketChartView:
             # label
             self.canvas.create_text(
                 x_start + 1.5 * bar_width, base_line + 15, text=bucket_key,
-                font=(self.text_font[0], self.text_font[1], "bold"), fill="#FFFFFF"
+                font=self.bold_font, fill="#FFFFFF"
             )
 
         # Draw legend with more spacing and clearer separation from chart
@@ -435,6 +466,10 @@ class RoleDistributionChartView:
         self.bg = bg
         self.text_font = text_font
         self.parent = parent
+        # Derived label fonts, resolved once from the base font
+        family, size = _font_family_size(text_font)
+        self.bold_font = (family, size, "bold")
+        self.heading_font = (family, size + 1, "bold")
 
         self.canvas = tk.Canvas(parent, width=width, height=height, bg=bg, highlightthickness=1, highlightbackground="#3D4663")
         self.canvas.pack(side=tk.BOTTOM, padx=10, pady=5, fill=tk.BOTH, expand=True)
@@ -445,6 +480,10 @@ class RoleDistributionChartView:
         # Store the current data for redrawing on resize
         self.current_stats = None
         self.current_logic = None
+        
+        # While suspended (e.g. covered by the banner) draws are deferred
+        self.suspended = False
+        self._chart_dirty = False
 
     def _on_resize(self, event):
         """Handle window resize event"""
@@ -456,6 +495,14 @@ class RoleDistributionChartView:
         if self.current_stats:
             self.draw(self.current_stats, self.current_logic)
 
+    def set_suspended(self, suspended):
+        """Suspend or resume drawing; resuming redraws if an update was deferred"""
+        self.suspended = suspended
+        if not suspended and self._chart_dirty:
+            self._chart_dirty = False
+            if self.current_stats:
+                self.draw(self.current_stats, self.current_logic)
+
     def draw(self, stats: dict, logic=None):
         """
         stats => from logic.get_role_distribution_stats(), e.g.:
@@ -467,6 +514,10 @@ class RoleDistributionChartView:
         self.current_stats = stats
         self.current_logic = logic
         
+        if self.suspended:
+            self._chart_dirty = True
+            return
+        
         self.canvas.delete("all")
         if not stats:
             return
@@ -479,7 +530,7 @@ class RoleDistributionChartView:
         if has_priority_data:
             priority_counts = self._get_priority_counts(logic)
 
-        roles_list = list(stats.keys())
+        roles_list = list(stats)
         counts = []
         mmrs = []
         for r in roles_list:
@@ -608,7 +659,7 @@ class RoleDistributionChartView:
             self.canvas.create_text(
                 x_start + group_width / 2, base_line + 15,
                 text=rname, fill="#FFFFFF",
-                font=(self.text_font[0], self.text_font[1] + 1, "bold")
+                font=self.heading_font
             )
 
         # Draw legend at the bottom with clear separation from chart
@@ -667,29 +718,10 @@ class RoleDistributionChartView:
         """
         Calculate how many players have each role at priority 1, 2, and 3.
         Returns a nested dictionary: { role: { priority: count } }
-        """
-        result = {}
-        
-        # Initialize the dictionary structure
-        for role in logic.roles:
-            result[role] = {1: 0, 2: 0, 3: 0}
-        
-        # Get already drafted players
-        drafted_players = set()
-        for team_data in logic.teams.values():
-            for player, _ in team_data["players"]:
-                drafted_players.add(player)
         
-        # Count priorities for undrafted players
-        for player_name, player_data in logic.all_players.items():
-            if player_name in drafted_players:
-                continue
-                
-            for role_name, priority in player_data["roles"]:
-                if role_name in result and 1 <= priority <= 3:
-                    result[role_name][priority] += 1
-        
-        return result
+        The counts are kept up to date by the logic as players are picked and restored.
+        """
+        return logic.get_role_priority_counts()
 
 
 # Function to bind Enter key to Spin button in the main application
@@ -256,9 +256,16 @@ class BannerPanel:
         self.banner_visible = True
         self.banner_img = None
         self._banner_label_ref = None
+        self._banner_mtime = None
+        self._banner_source = None
+        self._banner_scaled_size = None
+        self._banner_resize_job = None
         
         # Create banner frame
         self.banner_frame = tk.Frame(parent, bg=ui_config["banner_bg_color"])
+        # Let the grid cell size the frame so the scaled image can't feed back into the layout
+        self.banner_frame.pack_propagate(False)
+        self.banner_frame.bind("<Configure>", self._on_banner_configure)
         
     def setup_banner(self):
         """Set up the banner image or text"""
@@ -269,8 +276,15 @@ class BannerPanel:
         banner_path = "banner.png"
         if os.path.exists(banner_path):
             try:
-                # Make sure to keep a reference to the image to prevent garbage collection
-                self.banner_img = ImageTk.PhotoImage(Image.open(banner_path))
+                # Reuse the decoded image unless the file changed on disk
+                mtime = os.path.getmtime(banner_path)
+                if self.banner_img is None or mtime != self._banner_mtime:
+                    self._banner_source = Image.open(banner_path)
+                    self._banner_source.load()
+                    # Make sure to keep a reference to the image to prevent garbage collection
+                    self.banner_img = ImageTk.PhotoImage(self._banner_source)
+                    self._banner_mtime = mtime
+                    self._banner_scaled_size = None
                 banner_label = tk.Label(self.banner_frame, image=self.banner_img)
                 banner_label.pack(fill=tk.BOTH, expand=True)
                 
@@ -296,6 +310,42 @@ class BannerPanel:
             placeholder_label.pack(fill=tk.BOTH, expand=True, pady=self.ui_config["padding"]*2)
             print("[INFO] No banner.png found, using text placeholder")
     
+    def _on_banner_configure(self, event):
+        """Rescale the banner image to fit the frame while it is being resized"""
+        if self._banner_source is None or self._banner_label_ref is None:
+            return
+        
+        # Fit inside the frame while keeping the image aspect ratio
+        src_w, src_h = self._banner_source.size
+        scale = min(event.width / src_w, event.height / src_h)
+        size = (max(1, int(src_w * scale)), max(1, int(src_h * scale)))
+        if size == self._banner_scaled_size:
+            return
+        
+        # Cheap nearest-neighbour scaling while dragging, high quality once resizing settles
+        self._apply_banner_scale(size, Image.NEAREST)
+        if self._banner_resize_job is not None:
+            self.banner_frame.after_cancel(self._banner_resize_job)
+        self._banner_resize_job = self.banner_frame.after(
+            300, lambda: self._apply_banner_scale(size, Image.LANCZOS)
+        )
+    
+    def _apply_banner_scale(self, size, resample):
+        """
+        Show the banner image scaled to the given size
+        
+        Args:
+            size: Target (width, height) in pixels
+            resample: PIL resampling filter to use
+        """
+        if resample == Image.LANCZOS:
+            self._banner_resize_job = None
+        if self._banner_source is None or not self._banner_label_ref.winfo_exists():
+            return
+        self.banner_img = ImageTk.PhotoImage(self._banner_source.resize(size, resample))
+        self._banner_label_ref.configure(image=self.banner_img)
+        self._banner_scaled_size = size
+    
     def show(self, grid_params=None):
         """
         Show the banner
@@ -4,6 +4,8 @@ Handles the probability display and sigmoid chart
 """
 import tkinter as tk
 from tkinter import ttk
+from itertools import cycle
+from operator import itemgetter
 
 class ProbabilityView:
     """Component for displaying probabilities and sigmoid chart"""
@@ -22,6 +24,18 @@ class ProbabilityView:
         self.sigmoid_data = None
         self.sigmoid_ideal_mmr = 0
         
+        # Palette and the matching Treeview row tag names, looked up by index
+        self._team_color_list = tuple(ui_config["team_colors"])
+        self._team_color_len = len(self._team_color_list)
+        self._team_color_tags = tuple(f"team{i}" for i in range(self._team_color_len))
+        
+        # Treeview row ids in display order, reused across updates
+        self._row_ids = []
+        
+        # One Style handle for this view; each style name is configured only once
+        self._ttk_style = ttk.Style()
+        self._configured_styles = set()
+        
         # Create probability tree view
         self._create_probability_tree()
         
@@ -96,6 +110,10 @@ class ProbabilityView:
         self.prob_tree.column("prob", width=70)
         self.prob_tree.column("pref", width=40)
         
+        # Declare one row tag per palette color up front; rows only reference tags
+        for tag, color in zip(self._team_color_tags, self._team_color_list):
+            self.prob_tree.tag_configure(tag, background=color)
+        
         # Add stylish scrollbars
         prob_tree_yscroll = ttk.Scrollbar(prob_tree_frame, orient="vertical", 
                                          command=self.prob_tree.yview, 
@@ -166,10 +184,8 @@ class ProbabilityView:
     
     def _create_tree_style(self):
         """Create a custom style for the treeview"""
-        style = ttk.Style()
-        
         # Configure the Treeview style
-        style.configure("Gaming.Treeview",
+        self._configure_style("Gaming.Treeview",
                       background="#1E1E2F",
                       foreground="white",
                       fieldbackground="#1E1E2F",
@@ -178,7 +194,7 @@ class ProbabilityView:
                            self.ui_config["tree_font_size"], "bold"))
         
         # Configure the heading style
-        style.configure("Gaming.Treeview.Heading",
+        self._configure_style("Gaming.Treeview.Heading",
                       background="#222233",
                       foreground="#00aaff",
                       relief="flat",
@@ -186,17 +202,30 @@ class ProbabilityView:
                            self.ui_config["tree_header_font_size"], "bold"))
         
         # Configure scrollbar styles
-        style.configure("Gaming.Vertical.TScrollbar", 
+        self._configure_style("Gaming.Vertical.TScrollbar", 
                       background="#222233",
                       arrowcolor="#00aaff",
                       bordercolor="#00aaff",
                       troughcolor="#1E1E2F")
         
-        style.configure("Gaming.Horizontal.TScrollbar", 
+        self._configure_style("Gaming.Horizontal.TScrollbar", 
                       background="#222233",
                       arrowcolor="#00aaff",
                       bordercolor="#00aaff",
                       troughcolor="#1E1E2F")
+    
+    def _configure_style(self, style_name, **options):
+        """
+        Configure a ttk style unless this view has already configured it
+        
+        Args:
+            style_name: ttk style name
+            **options: Style options passed to ttk.Style.configure
+        """
+        if style_name in self._configured_styles:
+            return
+        self._ttk_style.configure(style_name, **options)
+        self._configured_styles.add(style_name)
         
     def update_probabilities(self, probs, player_mmrs, ideal_mmr, role_prefs=None):
         """
@@ -204,78 +233,64 @@ class ProbabilityView:
         
         Args:
             probs: Dict of {player: probability}
-            player_mmrs: Dict of {player: mmr}
+            player_mmrs: Dict of {player: mmr}; may hold more players than probs
             ideal_mmr: Ideal MMR for the pick
-            role_prefs: Dict of {player: preference} for the current role
+            role_prefs: Dict of {player: preference} for the current role (missing = 1)
         """
         if not probs:
             self.clear()
             return
             
-        # Clear existing items
-        for item in self.prob_tree.get_children():
-            self.prob_tree.delete(item)
-        
-        # Build data (player, mmr, diff, prob) and sort by MMR
-        data_list = []
-        for p, prob_val in probs.items():
-            pm = player_mmrs[p]
-            diff_val = abs(pm - ideal_mmr)
-            pref = role_prefs.get(p, 1) if role_prefs else 1
-            data_list.append((p, pm, diff_val, prob_val, pref))
-            
-        # Sort by MMR ascending
-        data_list.sort(key=lambda x: x[1])
+        # Gather the candidates' MMRs and preferences as parallel columns
+        names = list(probs)
+        mmrs = list(map(player_mmrs.__getitem__, names))
+        pref_of = (role_prefs or {}).get
+        pref_col = [pref_of(p, 1) for p in names]
+        
+        # Build data (player, mmr, diff, prob, pref) sorted by MMR ascending
+        data_list = sorted(
+            zip(names, mmrs, [abs(m - ideal_mmr) for m in mmrs], probs.values(), pref_col),
+            key=itemgetter(1)
+        )
         
         # Store for sigmoid chart
-        self.sigmoid_data = [(p, pm, diff_val, prob_val) for p, pm, diff_val, prob_val, _ in data_list]
+        self.sigmoid_data = [row[:4] for row in data_list]
         self.sigmoid_ideal_mmr = ideal_mmr
         
-        # Populate the Treeview in sorted order
-        idx = 0
-        for (p, pm, diff_val, prob_val, pref) in data_list:
+        # Populate the Treeview in sorted order, rewriting existing rows in place
+        tree = self.prob_tree
+        row_ids = self._row_ids
+        # A reused row shows another player now; don't carry its highlight over
+        tree.selection_remove(tree.selection())
+        
+        # Assign colors: players cycle through the palette in display order
+        self.player_colors.update(zip(map(itemgetter(0), data_list), cycle(self._team_color_list)))
+        
+        rows = zip(data_list, cycle(self._team_color_tags))
+        for idx, ((p, pm, diff_val, prob_val, pref), color_tag) in enumerate(rows):
             prob_pct = prob_val * 100.0
             prob_str = f"{prob_pct:.1f}%"
 
-            # Assign color
-            color = self._get_color(idx)
-            self.player_colors[p] = color
-
-            # Insert row into tree with custom style
-            style_name = f"PlayerRow_{idx}.Gaming.Treeview"
-            style = ttk.Style()
-            style.configure(style_name, 
-                          background=color,
-                          foreground="#FFFFFF",
-                          font=(self.ui_config["text_font_type"], 
-                               self.ui_config["tree_font_size"], "bold"))
-
-            row_id = self.prob_tree.insert("", "end", values=(p, int(pm), int(diff_val), prob_str, pref))
-            self.prob_tree.item(row_id, tags=(style_name,))
-            self.prob_tree.tag_configure(style_name, background=color)
-
-            idx += 1
+            # The palette tag depends only on the row position, so reused rows keep theirs
+            values = (p, int(pm), int(diff_val), prob_str, pref)
+            if idx < len(row_ids):
+                tree.item(row_ids[idx], values=values)
+            else:
+                row_ids.append(tree.insert("", "end", values=values, tags=(color_tag,)))
+        
+        # Drop rows left over from a longer previous list
+        if len(row_ids) > len(data_list):
+            tree.delete(*row_ids[len(data_list):])
+            del row_ids[len(data_list):]
     
     def clear(self):
         """Clear the probability display"""
-        for item in self.prob_tree.get_children():
-            self.prob_tree.delete(item)
+        if self._row_ids:
+            self.prob_tree.delete(*self._row_ids)
+            self._row_ids = []
         self.player_colors = {}
         self.sigmoid_data = None
     
-    def _get_color(self, idx):
-        """
-        Get a color for a player
-        
-        Args:
-            idx: Player index
-            
-        Returns:
-            str: Color hex code
-        """
-        colors = self.ui_config["team_colors"]
-        return colors[idx % len(colors)]
-    
     def get_player_colors(self):
         """
         Get the current player colors
@@ -289,6 +304,12 @@ class ProbabilityView:
 class SigmoidChartView:
     """Sigmoid chart view for probability visualization"""
     
+    # Axes padding - increased left padding for y-axis label
+    X_AXIS_PAD = 80  # left margin for Y axis - increased from 70
+    Y_AXIS_PAD = 40  # bottom margin for X axis
+    TOP_PAD = 40     # top padding - increased from 30
+    RIGHT_PAD = 40   # right padding - increased from 30
+    
     def __init__(self, parent, ui_config):
         """
         Initialize the sigmoid chart view
@@ -301,6 +322,13 @@ class SigmoidChartView:
         self.ui_config = ui_config
         self.player_colors = {}
         
+        # Font tuples used by the chart, built once instead of per draw call
+        font_type = ui_config["text_font_type"]
+        self._font_label = (font_type, 10, "bold")
+        self._font_axis_title = (font_type, 12, "bold")
+        self._font_title = (font_type, 11, "bold")
+        self._font_point = (font_type, 9, "bold")
+        
         # Create canvas for sigmoid chart
         self.sigmoid_canvas = tk.Canvas(parent, bg=ui_config["sigmoid_bg_color"])
         self.sigmoid_canvas.pack(fill=tk.BOTH, expand=True, 
@@ -313,50 +341,77 @@ class SigmoidChartView:
         # Data for redrawing
         self.data_list = None
         self.ideal_mmr = 0
+        # Canvas items per player for the scatter points, reused across redraws
+        self._scatter_item_ids = {}
+        # (w, h, min_mmr, max_mmr, y_max) the "axes" layer was drawn for
+        self._axes_signature = None
+        
+        # While suspended (e.g. covered by the banner) draws are deferred
+        self.suspended = False
+        self._chart_dirty = False
     
     def _on_canvas_resize(self, event):
         """Handle canvas resize by redrawing"""
         if self.data_list:
             self.draw_final_probability_curve(self.data_list, self.ideal_mmr)
     
+    def set_suspended(self, suspended):
+        """
+        Suspend or resume drawing
+        
+        Args:
+            suspended: True to defer draws, False to resume and flush a deferred draw
+        """
+        self.suspended = suspended
+        if not suspended and self._chart_dirty:
+            self._chart_dirty = False
+            if self.data_list:
+                self.draw_final_probability_curve(self.data_list, self.ideal_mmr)
+    
     def draw_final_probability_curve(self, data_list, ideal_mmr):
         """
         Draw a scatter plot of probability vs MMR
         
+        The background, grid, axes and titles ("axes" layer) are only redrawn
+        when the canvas size or the axis ranges change; the ideal MMR line and
+        the curve ("dynamic" layer) are redrawn every time.
+        
         Args:
-            data_list: List of (player, mmr, diff, probability) tuples
+            data_list: List of (player, mmr, diff, probability) tuples, sorted by MMR ascending
             ideal_mmr: Ideal MMR value to show as reference line
         """
         # Store data for redrawing on resize
         self.data_list = data_list
         self.ideal_mmr = ideal_mmr
         
-        # Clear canvas
-        self.sigmoid_canvas.delete("all")
+        if self.suspended:
+            self._chart_dirty = True
+            return
         
-        # Get canvas dimensions
-        w = int(self.sigmoid_canvas.winfo_width())
-        h = int(self.sigmoid_canvas.winfo_height())
+        # Bind hot canvas methods once for the whole draw
+        canvas = self.sigmoid_canvas
+        create_line = canvas.create_line
+        create_text = canvas.create_text
+        font_label = self._font_label
         
-        # If canvas is too small, skip drawing
-        if w < 50 or h < 50:
-            return
+        # Clear the dynamic layer; axes and scatter items are reused
+        canvas.delete("dynamic")
         
-        # Create gaming background
-        self._draw_gaming_background(w, h)
+        # Get canvas dimensions
+        w = int(canvas.winfo_width())
+        h = int(canvas.winfo_height())
+        
+        # If canvas is too small or there is nothing to plot, skip drawing
+        if w < 50 or h < 50 or not data_list:
+            canvas.delete("axes")
+            self._axes_signature = None
+            self._clear_scatter_items()
+            return
             
-        # Determine the MMR range and maximum probability
-        min_mmr = float('inf')
-        max_mmr = float('-inf')
-        max_prob = 0.0
-        
-        for (_, pm, _, prob_val) in data_list:
-            if pm < min_mmr:
-                min_mmr = pm
-            if pm > max_mmr:
-                max_mmr = pm
-            if prob_val > max_prob:
-                max_prob = prob_val
+        # Determine the MMR range (data is sorted by MMR) and maximum probability
+        min_mmr = data_list[0][1]
+        max_mmr = data_list[-1][1]
+        max_prob = max(0.0, max(row[3] for row in data_list))
 
         # Add padding to MMR range
         mmr_range = max_mmr - min_mmr
@@ -373,189 +428,265 @@ class SigmoidChartView:
         if y_max_value < 0.05:
             y_max_value = 0.05  # minimal range
 
-        # Define axes padding - increased left padding for y-axis label
-        x_axis_pad = 80  # left margin for Y axis - increased from 70
-        y_axis_pad = 40  # bottom margin for X axis
-        top_pad = 40     # top padding - increased from 30
-        right_pad = 40   # right padding - increased from 30
+        x_axis_pad = self.X_AXIS_PAD
+        y_axis_pad = self.Y_AXIS_PAD
+        top_pad = self.TOP_PAD
+        right_pad = self.RIGHT_PAD
+
+        # Affine MMR/probability -> canvas mapping, scalars computed once per draw
+        mmr_span = max_mmr - min_mmr
+        sx = (w - right_pad - x_axis_pad) / mmr_span if mmr_span else 0.0
+        x0 = x_axis_pad - min_mmr * sx
+        y0 = h - y_axis_pad
+        sy = (y0 - top_pad) / y_max_value
+
+        # Static layer: only rebuilt when size or axis ranges change
+        axes_signature = (w, h, min_mmr, max_mmr, y_max_value)
+        if axes_signature != self._axes_signature:
+            canvas.delete("axes")
+            self._draw_sigmoid_axes(w, h, min_mmr, max_mmr, y_max_value)
+            self._axes_signature = axes_signature
+        
+        # Draw ideal MMR reference line as a thin dotted line
+        if ideal_mmr > 0:
+            x_ideal = x0 + ideal_mmr * sx
+            
+            # Create thin dotted red line
+            create_line(
+                x_ideal, h - y_axis_pad,
+                x_ideal, top_pad,
+                width=1,
+                fill="#ff0000",
+                dash=(3, 3),  # Create dotted line pattern
+                tags="dynamic"
+            )
+            
+            # Draw label for ideal MMR at the bottom instead of top
+            create_text(
+                x_ideal+1, h - y_axis_pad - 15,  # Moved up above X axis
+                text=f"Ideal MMR: {int(ideal_mmr):,}",
+                font=font_label,
+                fill="#000000", anchor="s",  # Changed anchor to south
+                tags="dynamic"
+            )
+            create_text(
+                x_ideal, h - y_axis_pad - 16,  # Moved up above X axis
+                text=f"Ideal MMR: {int(ideal_mmr):,}",
+                font=font_label,
+                fill="#ff0000", anchor="s",  # Changed anchor to south
+                tags="dynamic"
+            )
+
+        # Draw data points, reusing each player's items from the previous draw
+        canvas.tag_raise("scatter")
+        dot_size = 6
+        colors = self.player_colors
+        scatter_item_ids = self._scatter_item_ids
+        drawn_players = set()
+        for player, mmr, _, prob in data_list:
+            # Calculate position
+            x = x0 + mmr * sx
+            y = y0 - prob * sy
+            
+            player_color = colors.get(player, "#ffffff")
+            
+            item_ids = scatter_item_ids.get(player)
+            if item_ids is None:
+                item_ids = self._create_scatter_items(player)
+                scatter_item_ids[player] = item_ids
+            oval_id, shadow_id, text_id = item_ids
+            
+            # Move the dot and the player name with its shadow
+            canvas.coords(oval_id, x-dot_size, y-dot_size, x+dot_size, y+dot_size)
+            canvas.itemconfigure(oval_id, fill=player_color)
+            canvas.coords(shadow_id, x+1, y-dot_size-6)
+            canvas.coords(text_id, x, y-dot_size-7)
+            drawn_players.add(player)
+        
+        # Drop items of players that are no longer in the data
+        for player in [p for p in scatter_item_ids if p not in drawn_players]:
+            canvas.delete(*scatter_item_ids.pop(player))
+            
+        # Connect the points to form a curve, already sorted by MMR
+        curve_points = []
+        for _, mmr, _, prob in data_list:
+            curve_points.extend([x0 + mmr * sx, y0 - prob * sy])
+            
+        if len(curve_points) >= 4:  # Need at least 2 points
+            create_line(
+                *curve_points,
+                fill="#00aaff", width=2, smooth=True,
+                tags="dynamic"
+            )
+        
+        # Keep the chart title above the data
+        canvas.tag_raise("chart_title")
+    
+    def _draw_sigmoid_axes(self, w, h, min_mmr, max_mmr, y_max_value):
+        """
+        Draw the static layer of the chart: background, grid, axes, tick labels and titles
+        
+        All items are tagged "axes".
+        
+        Args:
+            w: Canvas width
+            h: Canvas height
+            min_mmr: MMR at the left end of the X axis
+            max_mmr: MMR at the right end of the X axis
+            y_max_value: Probability at the top of the Y axis
+        """
+        canvas = self.sigmoid_canvas
+        create_line = canvas.create_line
+        create_text = canvas.create_text
+        font_label = self._font_label
+        font_axis_title = self._font_axis_title
+        
+        x_axis_pad = self.X_AXIS_PAD
+        y_axis_pad = self.Y_AXIS_PAD
+        top_pad = self.TOP_PAD
+        right_pad = self.RIGHT_PAD
+        
+        # Create gaming background
+        self._draw_gaming_background(w, h)
 
         # Draw the grid first
         self._draw_grid(w, h, x_axis_pad, y_axis_pad, top_pad, right_pad, min_mmr, max_mmr, y_max_value)
 
         # Draw the X-axis (horizontal) with gaming aesthetic
-        self.sigmoid_canvas.create_line(
+        create_line(
             x_axis_pad, h - y_axis_pad,  # start
             w - right_pad, h - y_axis_pad,  # end
-            fill="#00aaff", width=2
+            fill="#00aaff", width=2, tags="axes"
         )
         
         # Draw tick marks and labels on X-axis
         x_ticks = 5
-        mmr_range = max_mmr - min_mmr
+        x_step = (w - x_axis_pad - right_pad) / x_ticks
+        mmr_step = (max_mmr - min_mmr) / x_ticks
         for i in range(x_ticks + 1):
-            x_pos = x_axis_pad + ((w - x_axis_pad - right_pad) / x_ticks) * i
-            tick_mmr = min_mmr + (mmr_range / x_ticks) * i
+            x_pos = x_axis_pad + x_step * i
+            tick_mmr = min_mmr + mmr_step * i
             
             # Tick mark
-            self.sigmoid_canvas.create_line(
+            create_line(
                 x_pos, h - y_axis_pad,
                 x_pos, h - y_axis_pad + 5,
-                fill="#00aaff", width=2
+                fill="#00aaff", width=2, tags="axes"
             )
             
             # MMR label with shadow
-            self.sigmoid_canvas.create_text(
+            create_text(
                 x_pos+1, h - y_axis_pad + 12,
                 text=f"{int(tick_mmr):,}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#000000", anchor="n"
+                font=font_label,
+                fill="#000000", anchor="n", tags="axes"
             )
-            self.sigmoid_canvas.create_text(
+            create_text(
                 x_pos, h - y_axis_pad + 10,
                 text=f"{int(tick_mmr):,}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#cccccc", anchor="n"
+                font=font_label,
+                fill="#cccccc", anchor="n", tags="axes"
             )
 
         # Draw the Y-axis (vertical) with gaming aesthetic
-        self.sigmoid_canvas.create_line(
+        create_line(
             x_axis_pad, h - y_axis_pad,
             x_axis_pad, top_pad,
-            fill="#00aaff", width=2
+            fill="#00aaff", width=2, tags="axes"
         )
         
         # Draw tick marks and labels on Y-axis
         y_ticks = 5
+        y0 = h - y_axis_pad
+        y_step = (y0 - top_pad) / y_ticks
+        prob_step = y_max_value / y_ticks
         for i in range(y_ticks + 1):
-            y_pos = h - y_axis_pad - ((h - y_axis_pad - top_pad) / y_ticks) * i
-            tick_prob = (y_max_value / y_ticks) * i
+            y_pos = y0 - y_step * i
+            tick_prob = prob_step * i
             
             # Tick mark
-            self.sigmoid_canvas.create_line(
+            create_line(
                 x_axis_pad, y_pos,
                 x_axis_pad - 5, y_pos,
-                fill="#00aaff", width=2
+                fill="#00aaff", width=2, tags="axes"
             )
             
             # Probability label with shadow
-            self.sigmoid_canvas.create_text(
+            create_text(
                 x_axis_pad - 11, y_pos+1,
                 text=f"{tick_prob:.1%}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#000000", anchor="e"
+                font=font_label,
+                fill="#000000", anchor="e", tags="axes"
             )
-            self.sigmoid_canvas.create_text(
+            create_text(
                 x_axis_pad - 10, y_pos,
                 text=f"{tick_prob:.1%}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#cccccc", anchor="e"
+                font=font_label,
+                fill="#cccccc", anchor="e", tags="axes"
             )
             
         # Draw axis titles with gaming aesthetic
         # X-axis title
-        self.sigmoid_canvas.create_text(
+        create_text(
             w/2+1, h-5,
             text="MMR",
-            font=(self.ui_config["text_font_type"], 12, "bold"),
-            fill="#000000", anchor="s"
+            font=font_axis_title,
+            fill="#000000", anchor="s", tags="axes"
         )
-        self.sigmoid_canvas.create_text(
+        create_text(
             w/2, h-7,
             text="MMR",
-            font=(self.ui_config["text_font_type"], 12, "bold"),
-            fill="#00aaff", anchor="s"
+            font=font_axis_title,
+            fill="#00aaff", anchor="s", tags="axes"
         )
         
         # Y-axis title - adjusted position to avoid cutting off
-        self.sigmoid_canvas.create_text(
+        create_text(
             25, h/2,  # Moved from 10 to 25 to give more space
             text="PROBABILITY",
-            font=(self.ui_config["text_font_type"], 12, "bold"),
-            fill="#00aaff", angle=90, anchor="s"
+            font=font_axis_title,
+            fill="#00aaff", angle=90, anchor="s", tags="axes"
         )
         
-        # Draw ideal MMR reference line as a thin dotted line
-        if ideal_mmr > 0:
-            x_ideal = self._mmr_to_x(ideal_mmr, min_mmr, max_mmr, x_axis_pad, w - right_pad)
-            
-            # Create thin dotted red line
-            self.sigmoid_canvas.create_line(
-                x_ideal, h - y_axis_pad,
-                x_ideal, top_pad,
-                width=1,
-                fill="#ff0000",
-                dash=(3, 3)  # Create dotted line pattern
-            )
-            
-            # Draw label for ideal MMR at the bottom instead of top
-            self.sigmoid_canvas.create_text(
-                x_ideal+1, h - y_axis_pad - 15,  # Moved up above X axis
-                text=f"Ideal MMR: {int(ideal_mmr):,}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#000000", anchor="s"  # Changed anchor to south
-            )
-            self.sigmoid_canvas.create_text(
-                x_ideal, h - y_axis_pad - 16,  # Moved up above X axis
-                text=f"Ideal MMR: {int(ideal_mmr):,}",
-                font=(self.ui_config["text_font_type"], 10, "bold"),
-                fill="#ff0000", anchor="s"  # Changed anchor to south
-            )
-
-        # Draw data points
-        for player, mmr, _, prob in data_list:
-            # Calculate position
-            x = self._mmr_to_x(mmr, min_mmr, max_mmr, x_axis_pad, w - right_pad)
-            y = self._prob_to_y(prob, y_max_value, h - y_axis_pad, top_pad)
-            
-            player_color = self.player_colors.get(player, "#ffffff")
-            
-            # Draw the dot
-            dot_size = 6
-            self.sigmoid_canvas.create_oval(
-                x-dot_size, y-dot_size, 
-                x+dot_size, y+dot_size, 
-                fill=player_color,
-                outline="#ffffff",
-                width=1
-            )
-            
-            # Draw player name with shadow
-            self.sigmoid_canvas.create_text(
-                x+1, y-dot_size-6,
-                text=player,
-                font=(self.ui_config["text_font_type"], 9, "bold"),
-                fill="#000000", anchor="s"
-            )
-            self.sigmoid_canvas.create_text(
-                x, y-dot_size-7,
-                text=player,
-                font=(self.ui_config["text_font_type"], 9, "bold"),
-                fill="#ffffff", anchor="s"
-            )
-            
-        # Connect the points to form a curve, sorted by MMR
-        sorted_data = sorted(data_list, key=lambda x: x[1])  # sort by MMR
-        if sorted_data:
-            curve_points = []
-            for _, mmr, _, prob in sorted_data:
-                x = self._mmr_to_x(mmr, min_mmr, max_mmr, x_axis_pad, w - right_pad)
-                y = self._prob_to_y(prob, y_max_value, h - y_axis_pad, top_pad)
-                curve_points.extend([x, y])
-                
-            if len(curve_points) >= 4:  # Need at least 2 points
-                self.sigmoid_canvas.create_line(
-                    *curve_points,
-                    fill="#00aaff", width=2, smooth=True
-                )
-        
         # Draw chart title
         self._draw_chart_title(w, "PROBABILITY DISTRIBUTION", top_pad-20)
+        canvas.tag_lower("axes")
     
     def clear(self):
         """Clear the sigmoid chart"""
         self.sigmoid_canvas.delete("all")
+        self._scatter_item_ids = {}
+        self._axes_signature = None
         self.data_list = None
         self.ideal_mmr = 0
+        self._chart_dirty = False
+    
+    def _create_scatter_items(self, player):
+        """
+        Create the dot and name items for one player's scatter point
+        
+        Args:
+            player: Player name
+            
+        Returns:
+            tuple: (oval_id, shadow_text_id, text_id)
+        """
+        font = self._font_point
+        oval_id = self.sigmoid_canvas.create_oval(
+            0, 0, 0, 0, outline="#ffffff", width=1, tags="scatter"
+        )
+        shadow_id = self.sigmoid_canvas.create_text(
+            0, 0, text=player, font=font, fill="#000000", anchor="s", tags="scatter"
+        )
+        text_id = self.sigmoid_canvas.create_text(
+            0, 0, text=player, font=font, fill="#ffffff", anchor="s", tags="scatter"
+        )
+        return oval_id, shadow_id, text_id
+    
+    def _clear_scatter_items(self):
+        """Delete all scatter point items"""
+        self.sigmoid_canvas.delete("scatter")
+        self._scatter_item_ids = {}
     
     def set_player_colors(self, colors):
         """
@@ -569,28 +700,29 @@ class SigmoidChartView:
     def _draw_gaming_background(self, w, h):
         """Draw a gaming-style background with gradient and accents"""
         # Draw dark background
-        self.sigmoid_canvas.create_rectangle(0, 0, w, h, fill="#222222", outline="")
+        self.sigmoid_canvas.create_rectangle(0, 0, w, h, fill="#222222", outline="", tags="axes")
         
         # Add subtle grid pattern
+        create_line = self.sigmoid_canvas.create_line
         for i in range(0, w, 30):
-            self.sigmoid_canvas.create_line(i, 0, i, h, fill="#2a2a2a", width=1)
+            create_line(i, 0, i, h, fill="#2a2a2a", width=1, tags="axes")
         
         for i in range(0, h, 30):
-            self.sigmoid_canvas.create_line(0, i, w, i, fill="#2a2a2a", width=1)
+            create_line(0, i, w, i, fill="#2a2a2a", width=1, tags="axes")
         
         # Draw border
-        self.sigmoid_canvas.create_rectangle(0, 0, w, h, fill="", outline="#444444", width=2)
+        self.sigmoid_canvas.create_rectangle(0, 0, w, h, fill="", outline="#444444", width=2, tags="axes")
         
         # Add corner accents
         corner_size = 15
-        self.sigmoid_canvas.create_line(0, 0, corner_size, 0, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(0, 0, 0, corner_size, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(w, 0, w-corner_size, 0, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(w, 0, w, corner_size, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(0, h, corner_size, h, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(0, h, 0, h-corner_size, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(w, h, w-corner_size, h, fill="#00aaff", width=2)
-        self.sigmoid_canvas.create_line(w, h, w, h-corner_size, fill="#00aaff", width=2)
+        self.sigmoid_canvas.create_line(0, 0, corner_size, 0, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(0, 0, 0, corner_size, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(w, 0, w-corner_size, 0, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(w, 0, w, corner_size, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(0, h, corner_size, h, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(0, h, 0, h-corner_size, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(w, h, w-corner_size, h, fill="#00aaff", width=2, tags="axes")
+        self.sigmoid_canvas.create_line(w, h, w, h-corner_size, fill="#00aaff", width=2, tags="axes")
     
     def _draw_grid(self, w, h, x_axis_pad, y_axis_pad, top_pad, right_pad, min_mmr, max_mmr, y_max):
         """Draw grid lines for the chart"""
@@ -606,7 +738,8 @@ class SigmoidChartView:
                 w - right_pad, y_pos,
                 fill="#444444",
                 width=1,
-                dash=dash_pattern
+                dash=dash_pattern,
+                tags="axes"
             )
         
         # Draw vertical grid lines
@@ -622,7 +755,8 @@ class SigmoidChartView:
                 x_pos, top_pad,
                 fill="#444444",
                 width=1,
-                dash=dash_pattern
+                dash=dash_pattern,
+                tags="axes"
             )
     
     def _draw_chart_title(self, w, title, y_pos):
@@ -638,32 +772,22 @@ class SigmoidChartView:
             y_pos + 10,  # Adjusted position
             fill="#191919",
             outline="#00aaff",
-            width=2
+            width=2,
+            tags=("axes", "chart_title")
         )
         
         # Draw title text with shadow - adjusted position
         self.sigmoid_canvas.create_text(
             w/2+1, y_pos+1,
             text=title,
-            font=(self.ui_config["text_font_type"], 11, "bold"),
-            fill="#000000"
+            font=self._font_title,
+            fill="#000000",
+            tags=("axes", "chart_title")
         )
         self.sigmoid_canvas.create_text(
             w/2, y_pos,
             text=title,
-            font=(self.ui_config["text_font_type"], 11, "bold"),
-            fill="#00aaff"
+            font=self._font_title,
+            fill="#00aaff",
+            tags=("axes", "chart_title")
         )
-    
-    def _mmr_to_x(self, mmr, min_mmr, max_mmr, x_min, x_max):
-        """Convert MMR value to X coordinate"""
-        mmr_range = max_mmr - min_mmr
-        if mmr_range == 0:
-            return x_min
-        return x_min + ((mmr - min_mmr) / mmr_range) * (x_max - x_min)
-    
-    def _prob_to_y(self, prob, max_prob, y_max, y_min):
-        """Convert probability value to Y coordinate"""
-        if max_prob == 0:
-            return y_max
-        return y_max - (prob / max_prob) * (y_max - y_min) 
\ No newline at end of file
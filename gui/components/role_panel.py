@@ -39,6 +39,8 @@ class RolePanel:
         
         # Store role buttons
         self.role_buttons = {}
+        # Position whose button currently has the selected style
+        self._styled_pos = None
     
     def create_role_buttons(self, container):
         """
@@ -70,21 +72,28 @@ class RolePanel:
             role: Role value to set
         """
         self.role_var.set(role)
-        # Call the callback after a short delay
+        # Flush the button restyle from the role_var trace, then request the preview
         if self.on_role_selected_callback:
-            self.parent.after(50, self.on_role_selected_callback)
+            self.parent.update_idletasks()
+            self.on_role_selected_callback()
     
     def _on_role_selected(self, *args):
         """Update button styling based on selected role"""
         selected_role = self.role_var.get()
         selected_pos = self.role_to_position.get(selected_role, "")
         
-        # Update button styling
-        for pos, btn in self.role_buttons.items():
-            if pos == selected_pos:
-                btn.configure(style="Selected.RoleButton.TButton")
-            else:
-                btn.configure(style="Default.RoleButton.TButton")
+        # Update button styling; only the previously and newly selected buttons change
+        if selected_pos == self._styled_pos:
+            return
+        old_btn = self.role_buttons.get(self._styled_pos)
+        if old_btn is not None:
+            old_btn.configure(style="Default.RoleButton.TButton")
+        new_btn = self.role_buttons.get(selected_pos)
+        if new_btn is not None:
+            new_btn.configure(style="Selected.RoleButton.TButton")
+            self._styled_pos = selected_pos
+        else:
+            self._styled_pos = None
     
     def get_selected_role(self):
         """
@@ -207,7 +216,7 @@ class RoleListPanel:
         
         # Rebuild role lists if they exist
         if hasattr(self, 'role_frames') and self.role_frames:
-            self.build_role_lists(list(self.role_frames.keys()))
+            self.build_role_lists(list(self.role_frames))
     
     def build_role_lists(self, role_names):
         """
@@ -340,6 +349,44 @@ class RoleListPanel:
         position_width = self.display_config["position_width"]
         name_width = self.display_config["name_width"]
         mmr_width = self.display_config["mmr_width"]
+        player_info = player_info or {}
+        
+        def format_entry(player, role):
+            mmr = 0
+            pref = 1  # Default preference
+            
+            # Get player info if available (single lookup per player)
+            info = player_info.get(player)
+            if info is not None:
+                mmr = info.mmr
+                
+                # Check roles preference
+                pref = info.roles_map.get(role, 1)
+            
+            # Format MMR with commas for readability
+            formatted_mmr = f"{mmr:,}" if mmr else "0"
+            
+            # Convert preference to position indicator
+            position = ""
+            if pref == 1:
+                position = "1st"  # Fixed - no extra space
+            elif pref == 2:
+                position = "2nd"
+            elif pref == 3:
+                position = "3rd"
+            elif pref >= 4:
+                position = f"{pref}th"
+            else:
+                position = "--"  # For zero or negative preference
+            
+            # Truncate long player names and ensure consistent spacing
+            if len(player) > max_name_length:
+                display_name = player[:truncated_length] + ".."
+            else:
+                display_name = player
+                
+            # Format using configurable widths
+            return f"{position:<{position_width}} {display_name:<{name_width}} {formatted_mmr:>{mmr_width}}"
         
         for role, listbox_pair in self.role_frames.items():
             left_lb, right_lb = listbox_pair
@@ -351,89 +398,13 @@ class RoleListPanel:
                 # Split the players between the two columns
                 mid_point = len(players) // 2 + len(players) % 2  # Ceiling division
                 
-                # Fill left column
-                for i, player in enumerate(players[:mid_point]):
-                    mmr = 0
-                    pref = 1  # Default preference
-                    
-                    # Get player info if available
-                    if player_info and player in player_info:
-                        mmr = player_info[player]["mmr"]
-                        
-                        # Check roles preference
-                        if "roles" in player_info[player]:
-                            for role_info in player_info[player]["roles"]:
-                                if role_info[0] == role:
-                                    pref = role_info[1]
-                                    break
-                    
-                    # Format MMR with commas for readability
-                    formatted_mmr = f"{mmr:,}" if mmr else "0"
-                    
-                    # Convert preference to position indicator
-                    position = ""
-                    if pref == 1:
-                        position = "1st"  # Fixed - no extra space
-                    elif pref == 2:
-                        position = "2nd"
-                    elif pref == 3:
-                        position = "3rd"
-                    elif pref >= 4:
-                        position = f"{pref}th"
-                    else:
-                        position = "--"  # For zero or negative preference
-                    
-                    # Truncate long player names and ensure consistent spacing
-                    if len(player) > max_name_length:
-                        display_name = player[:truncated_length] + ".."
-                    else:
-                        display_name = player
-                        
-                    # Format using configurable widths
-                    entry_text = f"{position:<{position_width}} {display_name:<{name_width}} {formatted_mmr:>{mmr_width}}"
-                    left_lb.insert(tk.END, entry_text)
-                
-                # Fill right column
-                for i, player in enumerate(players[mid_point:]):
-                    mmr = 0
-                    pref = 1  # Default preference
-                    
-                    # Get player info if available
-                    if player_info and player in player_info:
-                        mmr = player_info[player]["mmr"]
-                        
-                        # Check roles preference
-                        if "roles" in player_info[player]:
-                            for role_info in player_info[player]["roles"]:
-                                if role_info[0] == role:
-                                    pref = role_info[1]
-                                    break
-                    
-                    # Format MMR with commas for readability
-                    formatted_mmr = f"{mmr:,}" if mmr else "0"
-                    
-                    # Convert preference to position indicator
-                    position = ""
-                    if pref == 1:
-                        position = "1st"  # Fixed - no extra space
-                    elif pref == 2:
-                        position = "2nd"
-                    elif pref == 3:
-                        position = "3rd"
-                    elif pref >= 4:
-                        position = f"{pref}th"
-                    else:
-                        position = "--"  # For zero or negative preference
-                    
-                    # Truncate long player names and ensure consistent spacing
-                    if len(player) > max_name_length:
-                        display_name = player[:truncated_length] + ".."
-                    else:
-                        display_name = player
-                        
-                    # Format using configurable widths
-                    entry_text = f"{position:<{position_width}} {display_name:<{name_width}} {formatted_mmr:>{mmr_width}}"
-                    right_lb.insert(tk.END, entry_text)
+                # Fill both columns, one insert call each
+                left_entries = [format_entry(player, role) for player in players[:mid_point]]
+                right_entries = [format_entry(player, role) for player in players[mid_point:]]
+                if left_entries:
+                    left_lb.insert(tk.END, *left_entries)
+                if right_entries:
+                    right_lb.insert(tk.END, *right_entries)
     
     def set_banner_image(self, image_path):
         """
@@ -9,6 +9,15 @@ import tkinter.font as tkfont
 class TeamPanel:
     """Team panel component for displaying and interacting with teams"""
     
+    # Position label shown for each drafted role
+    ROLE_TO_NUM = {
+        "carry": "POS 1",
+        "mid": "POS 2",
+        "offlane": "POS 3",
+        "soft_support": "POS 4", 
+        "hard_support": "POS 5"
+    }
+    
     def __init__(self, parent, ui_config, on_team_selected_callback):
         """
         Initialize the team panel
@@ -25,7 +34,12 @@ class TeamPanel:
         # Track the currently selected team
         self.selected_team_container = None
         self.team_containers = {}
+        # Widgets of each team card, reused across refreshes
+        self._team_cards = {}
         self.team_color_indices = {}
+        # Palette looked up by team color index
+        self._team_color_list = tuple(ui_config["team_colors"])
+        self._team_color_len = len(self._team_color_list)
         
         # Keep track of drag and drop state
         self.drag_data = {"x": 0, "y": 0, "item": None, "widget": None, "start_y": 0}
@@ -38,6 +52,24 @@ class TeamPanel:
         self.selection_color = "#4040A0"  # Selection background
         self.hover_color = "#3A3A5A"  # Hover color
         
+        # Find best monospace font once; font families don't change at runtime
+        font_family = "Courier"
+        available_fonts = tkfont.families()
+        monospace_options = ["Courier", "Consolas", "Courier New", "Monaco", "DejaVu Sans Mono"]
+        for font in monospace_options:
+            if font in available_fonts:
+                font_family = font
+                break
+        
+        # Named fonts shared by every team card, so new cards reuse them instead of
+        # resolving a font description per widget
+        self.header_font = tkfont.Font(root=parent, family=ui_config["text_font_type"],
+                                       size=ui_config["text_font_size"] + 1, weight="bold")
+        self.player_font = tkfont.Font(root=parent, family=font_family,
+                                       size=ui_config["text_font_size"], weight="bold")
+        self.picker_font = tkfont.Font(root=parent, family=ui_config["text_font_type"],
+                                       size=ui_config["text_font_size"], weight="normal")
+        
         # Configure the parent frame with the gaming theme
         parent.configure(bg=self.bg_color)
         
@@ -62,6 +94,7 @@ class TeamPanel:
         self.teams_canvas_window = self.teams_canvas.create_window((0, 0), window=self.teams_inner_frame, anchor="nw")
         
         # Bind event to resize the inner frame when canvas changes
+        self._scrollregion_pending = False
         self.teams_inner_frame.bind("<Configure>", self._on_teams_configure)
         self.teams_canvas.bind("<Configure>", self._on_canvas_configure)
         
@@ -73,6 +106,15 @@ class TeamPanel:
         
     def _on_teams_configure(self, event):
         """Handle teams container resize"""
+        # Cards added, removed or resized in one refresh share a single scrollregion update
+        if self._scrollregion_pending:
+            return
+        self._scrollregion_pending = True
+        self.teams_canvas.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        """Fit the scrollregion to the team cards"""
+        self._scrollregion_pending = False
         self.teams_canvas.configure(scrollregion=self.teams_canvas.bbox("all"))
             
     def _on_canvas_configure(self, event):
@@ -88,148 +130,200 @@ class TeamPanel:
         """
         Refresh the teams display
         
+        Team cards are built once per team and then updated in place; only
+        cards of teams that no longer exist are destroyed. Cards are re-packed
+        only when the team order differs from the order they were packed in.
+        
         Args:
             teams_data: Dict with team data
             current_team: Currently selected team ID
         """
-        for w in self.teams_inner_frame.winfo_children():
-            w.destroy()
+        # Drop cards of teams that are gone (e.g. after loading a draft)
+        for tid in [t for t in self._team_cards if t not in teams_data]:
+            self._team_cards.pop(tid)["container"].destroy()
+            self.team_containers.pop(tid, None)
 
-        idx = 0
         self.selected_team_container = None
-        
-        # Find best monospace font
-        font_family = "Courier"
-        font_size = self.ui_config["text_font_size"]
-        
-        # Try to find a good monospace font
-        available_fonts = tkfont.families()
-        monospace_options = ["Courier", "Consolas", "Courier New", "Monaco", "DejaVu Sans Mono"]
-        for font in monospace_options:
-            if font in available_fonts:
-                font_family = font
-                break
-                
-        header_font = (self.ui_config["text_font_type"], self.ui_config["text_font_size"] + 1, "bold")
-        player_font = (font_family, font_size, "bold")
 
-        for tid, tinfo in teams_data.items():
+        for idx, (tid, tinfo) in enumerate(teams_data.items()):
             # Use stored color index or assign a new one
             if tid not in self.team_color_indices:
                 self.team_color_indices[tid] = idx
             
-            color_idx = self.team_color_indices[tid]
-            team_bg = self._team_color(color_idx)
-            
-            # Create a main container for the team card with border
-            team_container = tk.Frame(self.teams_inner_frame, bd=2, relief=tk.GROOVE, 
-                                     highlightthickness=2, 
-                                     bg=self.frame_color,
-                                     highlightbackground=self.bg_color)
-            team_container.pack(side=tk.TOP, fill=tk.X, anchor="nw", 
-                               pady=self.ui_config["padding"], 
-                               padx=self.ui_config["padding"])
+            card = self._team_cards.get(tid)
+            if card is None:
+                card = self._create_team_card(tid, self.team_color_indices[tid])
+                self._team_cards[tid] = card
             
-            # Store the container reference for selection highlighting
-            self.team_containers[tid] = team_container
+            self._update_team_card(card, tinfo)
             
             # Highlight the currently selected team if applicable
+            team_container = card["container"]
             if tid == current_team:
                 team_container.config(highlightbackground=self.text_color)
                 self.selected_team_container = team_container
+            else:
+                team_container.config(highlightbackground=self.bg_color)
+
+        # _team_cards is kept in packing order; new cards are packed at the end
+        order = list(teams_data)
+        if order != list(self._team_cards):
+            # e.g. a loaded draft reusing team IDs in another order: chain every card
+            # after the first one, which leaves them in teams_data order
+            prev = None
+            for tid in order:
+                container = self._team_cards[tid]["container"]
+                if prev is not None:
+                    container.pack(side=tk.TOP, fill=tk.X, anchor="nw", after=prev,
+                                   pady=self.ui_config["padding"],
+                                   padx=self.ui_config["padding"])
+                prev = container
+            self._team_cards = {tid: self._team_cards[tid] for tid in order}
+
+    def _create_team_card(self, tid, color_idx):
+        """
+        Create the widgets of one team card
+        
+        Args:
+            tid: Team ID
+            color_idx: Color index of the team
             
-            # Create a drag handle at the top
-            drag_handle = tk.Frame(team_container, bg=self.frame_color, height=5, cursor="fleur")
-            drag_handle.pack(side=tk.TOP, fill=tk.X)
-            
-            # Set up drag and drop for reordering
-            drag_handle.bind("<ButtonPress-1>", lambda e, w=team_container: self._drag_start(e, w))
-            drag_handle.bind("<B1-Motion>", self._drag_motion)
-            drag_handle.bind("<ButtonRelease-1>", self._drag_end)
-            
-            # Create a header frame with team name and color picker
-            header_frame = tk.Frame(team_container, bg=self.frame_color)
-            header_frame.pack(side=tk.TOP, fill=tk.X, anchor="nw", padx=5, pady=2)
-            
-            # Team name label with gaming-themed style
-            name_label = tk.Label(
-                header_frame,
-                text=f"TEAM: {tid.upper()}",
-                bg=self.frame_color,
-                fg=self.heading_color,
-                font=header_font
-            )
-            name_label.pack(side=tk.LEFT, anchor=tk.W, padx=(0, 5))
-            
-            # Create a team-specific color button
-            self._create_color_picker(header_frame, team_bg, tid)
-            
-            # Team stats with gaming theme
-            stats_frame = tk.Frame(team_container, bg=self.frame_color)
-            stats_frame.pack(side=tk.TOP, fill=tk.X, anchor="nw", padx=5, pady=2)
-            
-            avg_mmr_int = int(tinfo["average_mmr"]) if tinfo["players"] else 0
-            mmr_label = tk.Label(
-                stats_frame,
-                text=f"Average MMR: {avg_mmr_int:,}",
-                bg=self.frame_color,
-                fg=self.text_color,
-                font=player_font
-            )
-            mmr_label.pack(side=tk.TOP, anchor=tk.W)
-            
-            count = len(tinfo["players"])
-            count_label = tk.Label(
-                stats_frame,
-                text=f"Players: {count}/5",
-                bg=self.frame_color,
-                fg=self.text_color,
-                font=player_font
-            )
-            count_label.pack(side=tk.TOP, anchor=tk.W)
-            
-            # Players list frame with gaming theme
-            plist_frame = tk.Frame(team_container, bg=self.frame_color)
-            plist_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
-            
-            # Display players with role using a consistent format
-            role_to_num = {
-                "carry": "POS 1",
-                "mid": "POS 2",
-                "offlane": "POS 3",
-                "soft_support": "POS 4", 
-                "hard_support": "POS 5"
-            }
-            
-            # Create a listbox for players with gaming theme
-            players_listbox = tk.Listbox(
-                plist_frame,
-                height=min(5, max(1, len(tinfo["players"]))),
-                font=player_font,
-                bg="#303050",  # Dark blue/purple background
-                fg=self.text_color,  # Cyan text
-                selectbackground=self.selection_color,  # Purple selection
-                selectforeground="#FFFFFF",  # White text for selected items
-                borderwidth=0,  # Remove border
-                highlightthickness=0  # Remove highlight border
-            )
-            players_listbox.pack(side=tk.TOP, fill=tk.X, expand=True)
-            
-            # Add players to listbox
-            for (pname, role) in tinfo["players"]:
-                if role == "(Captain)":
-                    line = f"(CAPTAIN) {pname}"
-                else:
-                    role_str = role_to_num.get(role, "???")
-                    line = f"{role_str:<7} {pname}"
-                    
-                players_listbox.insert(tk.END, line)
-            
-            # Make entire card clickable and add visual feedback
-            self._make_clickable(team_container, tid, team_container)
-            
-            # Update the index for next team
-            idx += 1
+        Returns:
+            dict: Widgets of the card that change between refreshes
+        """
+        team_bg = self._team_color(color_idx)
+        
+        # Create a main container for the team card with border
+        team_container = tk.Frame(self.teams_inner_frame, bd=2, relief=tk.GROOVE, 
+                                 highlightthickness=2, 
+                                 bg=self.frame_color,
+                                 highlightbackground=self.bg_color)
+        team_container.pack(side=tk.TOP, fill=tk.X, anchor="nw", 
+                           pady=self.ui_config["padding"], 
+                           padx=self.ui_config["padding"])
+        
+        # Store the container reference for selection highlighting
+        self.team_containers[tid] = team_container
+        
+        # Create a drag handle at the top
+        drag_handle = tk.Frame(team_container, bg=self.frame_color, height=5, cursor="fleur")
+        drag_handle.pack(side=tk.TOP, fill=tk.X)
+        
+        # Set up drag and drop for reordering
+        drag_handle.bind("<ButtonPress-1>", lambda e, w=team_container: self._drag_start(e, w))
+        drag_handle.bind("<B1-Motion>", self._drag_motion)
+        drag_handle.bind("<ButtonRelease-1>", self._drag_end)
+        
+        # Create a header frame with team name and color picker
+        header_frame = tk.Frame(team_container, bg=self.frame_color)
+        header_frame.pack(side=tk.TOP, fill=tk.X, anchor="nw", padx=5, pady=2)
+        
+        # Team name label with gaming-themed style
+        name_label = tk.Label(
+            header_frame,
+            text=f"TEAM: {tid.upper()}",
+            bg=self.frame_color,
+            fg=self.heading_color,
+            font=self.header_font
+        )
+        name_label.pack(side=tk.LEFT, anchor=tk.W, padx=(0, 5))
+        
+        # Create a team-specific color button
+        self._create_color_picker(header_frame, team_bg, tid)
+        
+        # Team stats with gaming theme
+        stats_frame = tk.Frame(team_container, bg=self.frame_color)
+        stats_frame.pack(side=tk.TOP, fill=tk.X, anchor="nw", padx=5, pady=2)
+        
+        mmr_label = tk.Label(
+            stats_frame,
+            bg=self.frame_color,
+            fg=self.text_color,
+            font=self.player_font
+        )
+        mmr_label.pack(side=tk.TOP, anchor=tk.W)
+        
+        count_label = tk.Label(
+            stats_frame,
+            bg=self.frame_color,
+            fg=self.text_color,
+            font=self.player_font
+        )
+        count_label.pack(side=tk.TOP, anchor=tk.W)
+        
+        # Players list frame with gaming theme
+        plist_frame = tk.Frame(team_container, bg=self.frame_color)
+        plist_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        
+        # Create a listbox for players with gaming theme
+        players_listbox = tk.Listbox(
+            plist_frame,
+            height=1,
+            font=self.player_font,
+            bg="#303050",  # Dark blue/purple background
+            fg=self.text_color,  # Cyan text
+            selectbackground=self.selection_color,  # Purple selection
+            selectforeground="#FFFFFF",  # White text for selected items
+            borderwidth=0,  # Remove border
+            highlightthickness=0  # Remove highlight border
+        )
+        players_listbox.pack(side=tk.TOP, fill=tk.X, expand=True)
+        
+        # Make entire card clickable and add visual feedback
+        self._make_clickable(team_container, tid, team_container)
+        
+        return {
+            "container": team_container,
+            "mmr_label": mmr_label,
+            "count_label": count_label,
+            "listbox": players_listbox,
+            "stats": None,
+            "lines": [],
+        }
+
+    def _update_team_card(self, card, tinfo):
+        """
+        Update the stats and player list of a team card in place
+        
+        Args:
+            card: Card widgets as returned by _create_team_card
+            tinfo: Team data with "players" and "average_mmr"
+        """
+        avg_mmr_int = int(tinfo["average_mmr"]) if tinfo["players"] else 0
+        count = len(tinfo["players"])
+        
+        # Reconfigure the stat labels only for teams whose numbers changed
+        stats = (avg_mmr_int, count)
+        if stats != card["stats"]:
+            card["mmr_label"].config(text=f"Average MMR: {avg_mmr_int:,}")
+            card["count_label"].config(text=f"Players: {count}/5")
+            card["stats"] = stats
+        
+        # Display players with role using a consistent format
+        lines = []
+        for (pname, role) in tinfo["players"]:
+            if role == "(Captain)":
+                lines.append(f"(CAPTAIN) {pname}")
+            else:
+                role_str = self.ROLE_TO_NUM.get(role, "???")
+                lines.append(f"{role_str:<7} {pname}")
+        
+        # Only touch the listbox rows that changed
+        old_lines = card["lines"]
+        if lines == old_lines:
+            return
+        players_listbox = card["listbox"]
+        common = 0
+        for old, new in zip(old_lines, lines):
+            if old != new:
+                break
+            common += 1
+        if common < len(old_lines):
+            players_listbox.delete(common, tk.END)
+        for line in lines[common:]:
+            players_listbox.insert(tk.END, line)
+        players_listbox.config(height=min(5, max(1, len(lines))))
+        card["lines"] = lines
 
     def _make_clickable(self, widget, tid, container):
         """
@@ -299,7 +393,7 @@ class TeamPanel:
             text="🎨",
             bg=self.frame_color,
             fg="#FFFFFF",
-            font=(self.ui_config["text_font_type"], self.ui_config["text_font_size"], "normal")
+            font=self.picker_font
         )
         color_btn.pack(side=tk.RIGHT, padx=5)
         
@@ -351,8 +445,7 @@ class TeamPanel:
         Returns:
             str: Color hex code
         """
-        team_colors = self.ui_config["team_colors"]
-        return team_colors[idx % len(team_colors)]
+        return self._team_color_list[idx % self._team_color_len]
         
     def get_team_color_indices(self):
         """
@@ -4,10 +4,26 @@ Handles the scale and probability visualization
 """
 import tkinter as tk
 import random
+import time
+from itertools import accumulate
 
 class WheelDisplay:
     """Wheel display for visualizing probabilities and spinning animation"""
     
+    # Number of horizontal strips used for each segment's gradient
+    GRADIENT_STEPS = 20
+    # Offsets of the black outline copies drawn behind each segment name
+    TEXT_OUTLINE_OFFSETS = [
+        (-1, -1), (0, -1), (1, -1),
+        (-1, 0),           (1, 0),
+        (-1, 1),  (0, 1),  (1, 1)
+    ]
+    # Spin animation timing (seconds unless noted)
+    PHYSICS_STEP = 0.004       # fixed physics substep
+    FRICTION_TICK = 0.02       # time span the friction factor and velocity refer to
+    MAX_PHYSICS_STEPS = 25     # substeps simulated at most per frame
+    FRAME_INTERVAL_MS = 16     # ~60 fps redraw
+    
     def __init__(self, parent, ui_config):
         """
         Initialize the wheel display
@@ -25,6 +41,14 @@ class WheelDisplay:
         self.wheel_font_type = ui_config.get("wheel_font_type", ui_config["text_font_type"])
         self.wheel_font_size = ui_config.get("wheel_font_size", ui_config["text_font_size"])
         
+        # Winner screen fonts, resolved once instead of on every spin
+        # Use a more impressive font - options that are likely to be available
+        name_font = "Palatino"  # Alternatives: "Georgia", "Copperplate", "Palatino"
+        grand_font = "Copperplate"  # Alternatives: "Georgia", "Copperplate", "Palatino"
+        self._winner_team_font = (grand_font, self.wheel_font_size+6, "bold")
+        self._winner_name_font = (name_font, self.wheel_font_size+12, "bold")  # Increased size
+        self._winner_detail_font = (grand_font, self.wheel_font_size, "bold")  # Smaller size
+        
         # Create the canvas for the scale display
         self.scale_canvas = tk.Canvas(parent, bg=ui_config["canvas_bg_color"])
         self.scale_canvas.pack(fill=tk.BOTH, expand=True, 
@@ -38,6 +62,19 @@ class WheelDisplay:
         self.bouncing = False
         self.friction = tk.DoubleVar(value=0.99)
         self.player_colors = {}
+        # Palette looked up by index when a player has no color yet
+        self._team_color_list = tuple(ui_config["team_colors"])
+        self._team_color_len = len(self._team_color_list)
+        # Canvas item ids per drawn scale segment, reused across redraws
+        self._scale_item_ids = []
+        # Size, segments and colors the scale was last drawn with
+        self._scale_state = None
+        # Canvas items of the pointer, moved with coords while spinning
+        self._pointer_item_ids = None
+        # Pointer position (in canvas pixels) of the last drawn animation frame
+        self._last_drawn_px = None
+        # (probabilities, segments) of the last build_segments call
+        self._segments_cache = (None, [])
         
         # Bind resize events
         self.scale_canvas.bind("<Configure>", self._on_scale_canvas_resize)
@@ -46,6 +83,7 @@ class WheelDisplay:
         """Handle scale canvas resize"""
         self.wheel_size = event.width
         self.wheel_height = event.height
+        self._last_drawn_px = None  # redraw the pointer on the next frame
         if self.scale_segments:
             self.draw_scale(self.scale_segments)
             
@@ -53,109 +91,173 @@ class WheelDisplay:
         """
         Draw the scale with player segments
         
+        Nothing is redrawn when the segments, their colors and the canvas size
+        are unchanged since the last call. Segment items are created once and
+        then moved/recolored in place; they are only recreated when the number
+        of segments changes.
+        
         Args:
             segs: List of (player, start_percent, end_percent) tuples
         """
-        self.scale_canvas.delete("all")
         w = self.wheel_size
         h = self.wheel_height
         
+        colors = self.player_colors
+        seg_colors = []
+        for idx, (p, _, _) in enumerate(segs):
+            color = colors.get(p)
+            if color is None:
+                color = colors[p] = self._get_color(idx)
+            seg_colors.append(color)
+        
+        scale_state = (w, h, list(segs), seg_colors)
+        if scale_state == self._scale_state:
+            return
+        
+        self._build_scale_background(w, h)
+        self._update_scale_segments(segs, seg_colors, w, h)
+        self._scale_state = scale_state
+        
+        # Keep a spinning pointer on top; drop a stale one otherwise
+        if self.bouncing:
+            self.scale_canvas.tag_raise("pointer")
+        else:
+            self.scale_canvas.delete("pointer")
+            self._pointer_item_ids = None
+    
+    def _build_scale_background(self, w, h):
+        """
+        Redraw the background layer of the scale for the given canvas size
+        
+        Args:
+            w: Canvas width
+            h: Canvas height
+        """
+        canvas = self.scale_canvas
+        canvas.delete("scale_bg")
+        
         # Create a modern dark background with subtle gradient
-        self.scale_canvas.create_rectangle(0, 0, w, h, outline="#141414", width=3, fill="#222222")
+        canvas.create_rectangle(0, 0, w, h, outline="#141414", width=3, fill="#222222", tags="scale_bg")
         
         # Add a subtle pattern to background
+        create_line = canvas.create_line
         for i in range(0, w, 20):
-            self.scale_canvas.create_line(i, 0, i, h, fill="#2a2a2a", width=1)
+            create_line(i, 0, i, h, fill="#2a2a2a", width=1, tags="scale_bg")
         
         # Create a border with gaming aesthetic
         border_width = 3
-        self.scale_canvas.create_line(0, 0, w, 0, fill="#444444", width=border_width)
-        self.scale_canvas.create_line(0, h, w, h, fill="#444444", width=border_width)
-        self.scale_canvas.create_line(0, 0, 0, h, fill="#444444", width=border_width)
-        self.scale_canvas.create_line(w, 0, w, h, fill="#444444", width=border_width)
+        canvas.create_line(0, 0, w, 0, fill="#444444", width=border_width, tags="scale_bg")
+        canvas.create_line(0, h, w, h, fill="#444444", width=border_width, tags="scale_bg")
+        canvas.create_line(0, 0, 0, h, fill="#444444", width=border_width, tags="scale_bg")
+        canvas.create_line(w, 0, w, h, fill="#444444", width=border_width, tags="scale_bg")
         
         # Add corner accents for gaming look
         corner_size = 15
-        self.scale_canvas.create_line(0, 0, corner_size, 0, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(0, 0, 0, corner_size, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(w, 0, w-corner_size, 0, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(w, 0, w, corner_size, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(0, h, corner_size, h, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(0, h, 0, h-corner_size, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(w, h, w-corner_size, h, fill="#00aaff", width=border_width)
-        self.scale_canvas.create_line(w, h, w, h-corner_size, fill="#00aaff", width=border_width)
-        
-        for idx, (p, start, end) in enumerate(segs):
-            x1 = (start/100) * w
-            x2 = (end/100) * w
-            color = self.player_colors.get(p, self._get_color(idx))
-            self.player_colors[p] = color
-            
-            # Create a gradient effect for each segment
-            gradient_steps = 20
-            segment_height = h / gradient_steps
-            for step in range(gradient_steps):
-                # Calculate gradient color - darker at top, brighter at bottom
-                brightness_factor = 0.7 + (step / gradient_steps) * 0.5
-                r, g, b = self._hex_to_rgb(color)
-                gradient_color = self._rgb_to_hex(
-                    min(255, int(r * brightness_factor)),
-                    min(255, int(g * brightness_factor)),
-                    min(255, int(b * brightness_factor))
-                )
-                
-                # Draw gradient rectangle
-                y1 = step * segment_height
-                y2 = (step + 1) * segment_height
-                self.scale_canvas.create_rectangle(
-                    x1, y1, x2, y2, 
-                    fill=gradient_color, 
-                    outline="",
-                )
-            
-            # Add a subtle glow effect
-            glow_color = self._create_lighter_color(color, 0.3)
-            self.scale_canvas.create_rectangle(
-                x1, 0, x2, h,
-                outline=glow_color,
-                width=2,
-                fill=""
+        canvas.create_line(0, 0, corner_size, 0, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(0, 0, 0, corner_size, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(w, 0, w-corner_size, 0, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(w, 0, w, corner_size, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(0, h, corner_size, h, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(0, h, 0, h-corner_size, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(w, h, w-corner_size, h, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.create_line(w, h, w, h-corner_size, fill="#00aaff", width=border_width, tags="scale_bg")
+        canvas.tag_lower("scale_bg")
+    
+    def _update_scale_segments(self, segs, seg_colors, w, h):
+        """
+        Move and recolor the segment items to match the given segments
+        
+        Args:
+            segs: List of (player, start_percent, end_percent) tuples
+            seg_colors: Color of each segment
+            w: Canvas width
+            h: Canvas height
+        """
+        # Only recreate segment items when the segment count changes
+        if len(segs) != len(self._scale_item_ids):
+            self.scale_canvas.delete("scale_seg")
+            self._scale_item_ids = [self._create_segment_items() for _ in segs]
+        
+        update_segment_items = self._update_segment_items
+        for (p, start, end), color, item_ids in zip(segs, seg_colors, self._scale_item_ids):
+            update_segment_items(item_ids, p, color, start, end, w, h)
+    
+    def _create_segment_items(self):
+        """
+        Create the canvas items for one scale segment
+        
+        Returns:
+            dict: Item ids for the gradient strips, glow border and name texts
+        """
+        canvas = self.scale_canvas
+        font = (self.wheel_font_type, self.wheel_font_size, "bold")
+        
+        # Create a gradient effect for each segment
+        gradient_ids = [
+            canvas.create_rectangle(0, 0, 0, 0, outline="", tags="scale_seg")
+            for _ in range(self.GRADIENT_STEPS)
+        ]
+        
+        # Add a subtle glow effect
+        glow_id = canvas.create_rectangle(0, 0, 0, 0, width=2, fill="", tags="scale_seg")
+        
+        # Create text with multiple outlines for better visibility
+        # This approach avoids the black rectangle issue while keeping rotation
+        text_ids = []
+        for _ in self.TEXT_OUTLINE_OFFSETS:
+            text_ids.append(canvas.create_text(
+                0, 0, font=font, fill="#000000", angle=90, tags="scale_seg"
+            ))
+        
+        # Create main text on top
+        text_ids.append(canvas.create_text(
+            0, 0, font=font, fill="#ffffff", angle=90, tags="scale_seg"
+        ))
+        
+        return {"gradient": gradient_ids, "glow": glow_id, "text": text_ids}
+    
+    def _update_segment_items(self, item_ids, p, color, start, end, w, h):
+        """
+        Move and recolor the canvas items of one scale segment
+        
+        Args:
+            item_ids: Item ids returned by _create_segment_items
+            p: Player name shown on the segment
+            color: Segment base color
+            start: Segment start percent
+            end: Segment end percent
+            w: Canvas width
+            h: Canvas height
+        """
+        canvas = self.scale_canvas
+        x1 = (start/100) * w
+        x2 = (end/100) * w
+        
+        # Gradient color - darker at top, brighter at bottom
+        gradient_steps = self.GRADIENT_STEPS
+        segment_height = h / gradient_steps
+        r, g, b = self._hex_to_rgb(color)
+        for step, item_id in enumerate(item_ids["gradient"]):
+            brightness_factor = 0.7 + (step / gradient_steps) * 0.5
+            gradient_color = self._rgb_to_hex(
+                min(255, int(r * brightness_factor)),
+                min(255, int(g * brightness_factor)),
+                min(255, int(b * brightness_factor))
             )
-
-            # Add player name with better visibility
-            cx = (x1+x2)/2
-            cy = h/2
-            if (x2-x1) > 20:  # Only show text if segment is wide enough
-                # Get font settings from config, with fallbacks
-                font_type = self.wheel_font_type
-                font_size = self.wheel_font_size
-                
-                # Create text with multiple outlines for better visibility
-                # This approach avoids the black rectangle issue while keeping rotation
-                outline_offsets = [
-                    (-1, -1), (0, -1), (1, -1),
-                    (-1, 0),           (1, 0),
-                    (-1, 1),  (0, 1),  (1, 1)
-                ]
-                
-                # Create text outline first (black outline)
-                for dx, dy in outline_offsets:
-                    self.scale_canvas.create_text(
-                        cx+dx, cy+dy,
-                        text=p,
-                        font=(font_type, font_size, "bold"),
-                        fill="#000000",
-                        angle=90  # Add rotation back
-                    )
-                
-                # Create main text on top
-                self.scale_canvas.create_text(
-                    cx, cy,
-                    text=p,
-                    font=(font_type, font_size, "bold"),
-                    fill="#ffffff",
-                    angle=90  # Add rotation back
-                )
+            canvas.coords(item_id, x1, step * segment_height, x2, (step + 1) * segment_height)
+            canvas.itemconfigure(item_id, fill=gradient_color)
+        
+        canvas.coords(item_ids["glow"], x1, 0, x2, h)
+        canvas.itemconfigure(item_ids["glow"], outline=self._create_lighter_color(color, 0.3))
+        
+        # Add player name with better visibility, only if segment is wide enough
+        cx = (x1+x2)/2
+        cy = h/2
+        state = "normal" if (x2-x1) > 20 else "hidden"
+        offsets = self.TEXT_OUTLINE_OFFSETS + [(0, 0)]
+        for (dx, dy), item_id in zip(offsets, item_ids["text"]):
+            canvas.coords(item_id, cx+dx, cy+dy)
+            canvas.itemconfigure(item_id, text=p, state=state)
     
     def _hex_to_rgb(self, hex_color):
         """Convert hex color to RGB tuple"""
@@ -185,12 +287,14 @@ class WheelDisplay:
         Returns:
             str: Color hex code
         """
-        colors = self.ui_config["team_colors"]
-        return colors[idx % len(colors)]
+        return self._team_color_list[idx % self._team_color_len]
     
     def clear(self):
         """Clear the wheel display"""
         self.scale_canvas.delete("all")
+        self._scale_item_ids = []
+        self._scale_state = None
+        self._pointer_item_ids = None
         self.scale_segments = []
         self.player_colors = {}
     
@@ -205,66 +309,100 @@ class WheelDisplay:
         Returns:
             list: List of (player, start_percent, end_percent) tuples
         """
-        segs = []
-        current = 0.0
-        
         # Update player colors if provided
         if player_colors:
             self.player_colors = player_colors.copy()
-            
-        for p, val in probs.items():
-            width = val * 100.0
-            segs.append((p, current, current+width))
-            current += width
+        
+        # Preview and spin build segments from the same probabilities back to back
+        key = tuple(probs.items())
+        cached_key, segs = self._segments_cache
+        if key != cached_key:
+            # Segment ends are the running total of the widths; each starts where the previous ended
+            ends = list(accumulate(val * 100.0 for val in probs.values()))
+            segs = list(zip(probs, [0.0] + ends[:-1], ends))
+            self._segments_cache = (key, segs)
         
         self.scale_segments = segs
         return segs
     
     def draw_pointer(self):
-        """Draw the pointer on wheel during spin"""
-        w = self.scale_canvas.winfo_width()
-        h = self.scale_canvas.winfo_height()
+        """
+        Draw the pointer on wheel during spin
+        
+        The pointer items are created once and then only moved with coords.
+        """
+        canvas = self.scale_canvas
+        w = canvas.winfo_width()
+        h = canvas.winfo_height()
         px = (self.pointer_x/100) * w
         
-        # Draw glowing effect behind pointer - using solid colors
+        if self._pointer_item_ids is None:
+            self._pointer_item_ids = self._create_pointer_items()
+        glow_ids, line_id, head_id, base_id = self._pointer_item_ids
+        
+        # Glowing effect and pointer line
+        for item_id in glow_ids:
+            canvas.coords(item_id, px, 0, px, h)
+        canvas.coords(line_id, px, 0, px, h)
+        
+        # Pointer head (triangle)
+        arrow_size = 12
+        canvas.coords(head_id, px-arrow_size, 0, px+arrow_size, 0, px, arrow_size*1.5)
+        
+        # Pointer base
+        canvas.coords(base_id, px-arrow_size, h-arrow_size*1.5, px+arrow_size, h)
+        canvas.tag_raise("pointer")
+    
+    def _create_pointer_items(self):
+        """
+        Create the canvas items of the pointer; draw_pointer positions them
+        
+        Returns:
+            tuple: (glow_line_ids, line_id, head_id, base_id)
+        """
+        canvas = self.scale_canvas
+        
+        # Glowing effect behind pointer - using solid colors
         glow_width = 8
         glow_colors = ["#99ddff", "#66ccff", "#33bbff"]  # Increasingly brighter blue
+        glow_ids = []
         for i, color in enumerate(glow_colors):
             width = glow_width - i*2
-            self.scale_canvas.create_line(
-                px, 0, px, h, 
+            glow_ids.append(canvas.create_line(
+                0, 0, 0, 0, 
                 width=width+4, 
-                fill=color
-            )
+                fill=color,
+                tags="pointer"
+            ))
         
-        # Draw pointer with modern style
+        # Pointer with modern style
         pointer_width = 4
         pointer_color = "#00aaff"
-        self.scale_canvas.create_line(
-            px, 0, px, h, 
+        line_id = canvas.create_line(
+            0, 0, 0, 0, 
             width=pointer_width, 
-            fill=pointer_color
+            fill=pointer_color,
+            tags="pointer"
         )
         
-        # Draw pointer head (triangle)
-        arrow_size = 12
-        self.scale_canvas.create_polygon(
-            px-arrow_size, 0,
-            px+arrow_size, 0,
-            px, arrow_size*1.5,
+        # Pointer head (triangle)
+        head_id = canvas.create_polygon(
+            0, 0, 0, 0, 0, 0,
             fill=pointer_color,
             outline="#ffffff",
-            width=1
+            width=1,
+            tags="pointer"
         )
         
-        # Draw pointer base
-        self.scale_canvas.create_rectangle(
-            px-arrow_size, h-arrow_size*1.5,
-            px+arrow_size, h,
+        # Pointer base
+        base_id = canvas.create_rectangle(
+            0, 0, 0, 0,
             fill=pointer_color,
             outline="#ffffff",
-            width=1
+            width=1,
+            tags="pointer"
         )
+        return glow_ids, line_id, head_id, base_id
     
     def spin(self, callback_on_finish=None):
         """
@@ -283,35 +421,63 @@ class WheelDisplay:
 
         self.bouncing = True
         self._callback_on_finish = callback_on_finish
+        self._last_drawn_px = None  # always draw the first frame
+        self._last_tick_time = time.perf_counter()
+        self._physics_time = 0.0
+        
+        # The segments don't change during a spin; draw them once up front
+        self.draw_scale(self.scale_segments)
         self._update_bounce()
         return True
     
     def _update_bounce(self):
-        """Update pointer animation during spin"""
+        """
+        Update pointer animation during spin
+        
+        Physics advances in fixed PHYSICS_STEP substeps for the real time
+        elapsed since the last frame, then the pointer is drawn once.
+        """
         if not self.bouncing:
             return
+        
+        now = time.perf_counter()
+        self._physics_time += now - self._last_tick_time
+        self._last_tick_time = now
+        steps = min(int(self._physics_time / self.PHYSICS_STEP), self.MAX_PHYSICS_STEPS)
+        self._physics_time -= steps * self.PHYSICS_STEP
+        if self._physics_time > self.PHYSICS_STEP:
+            self._physics_time = 0.0  # drop time we could not catch up on after a stall
+        
+        # Friction and velocity are defined per FRICTION_TICK; scale them to one substep
+        step_scale = self.PHYSICS_STEP / self.FRICTION_TICK
+        step_friction = self.friction.get() ** step_scale
+        for _ in range(steps):
+            self.pointer_x += self.pointer_vel * step_scale
             
-        friction = self.friction.get()
-        self.pointer_x += self.pointer_vel
-        
-        if self.pointer_x < 0:
-            self.pointer_x = abs(self.pointer_x)
-            self.pointer_vel = -self.pointer_vel
-        elif self.pointer_x > 100:
-            excess = self.pointer_x - 100
-            self.pointer_x = 100 - excess
-            self.pointer_vel = -self.pointer_vel
+            if self.pointer_x < 0:
+                self.pointer_x = abs(self.pointer_x)
+                self.pointer_vel = -self.pointer_vel
+            elif self.pointer_x > 100:
+                excess = self.pointer_x - 100
+                self.pointer_x = 100 - excess
+                self.pointer_vel = -self.pointer_vel
 
-        self.pointer_vel *= friction
-        self.draw_scale(self.scale_segments)
-        self.draw_pointer()
+            self.pointer_vel *= step_friction
+            if abs(self.pointer_vel) < 0.2:
+                break
+        
+        # Skip the redraw while the pointer moves less than a pixel per frame
+        px = (self.pointer_x/100) * self.scale_canvas.winfo_width()
+        if self._last_drawn_px is None or abs(px - self._last_drawn_px) >= 1.0:
+            self.draw_pointer()
+            self._last_drawn_px = px
 
         if abs(self.pointer_vel) < 0.2:
             self.bouncing = False
             if self._callback_on_finish:
                 self._callback_on_finish(self.pointer_x)
         else:
-            self.parent.after(20, self._update_bounce)
+            self.parent.after(self.FRAME_INTERVAL_MS, self._update_bounce)
     
     def display_winner(self, player_name, color=None, team_id=None, mmr=None, role=None):
         """
@@ -325,6 +491,9 @@ class WheelDisplay:
             role: Role/position the player was drafted for
         """
         self.scale_canvas.delete("all")
+        self._scale_item_ids = []
+        self._scale_state = None
+        self._pointer_item_ids = None
         w = int(self.scale_canvas.winfo_width())
         h = int(self.scale_canvas.winfo_height())
         display_color = color if color else self.player_colors.get(player_name, "red")
@@ -400,18 +569,13 @@ class WheelDisplay:
             self.scale_canvas.create_line(x1, y1, x2, y2, fill="#00aaff", width=3)
             self.scale_canvas.create_line(x1, y1, x3, y3, fill="#00aaff", width=3)
         
-        # Use a more impressive font - options that are likely to be available
-        name_font = "Palatino"  # Alternatives: "Georgia", "Copperplate", "Palatino"
-        grand_font = "Copperplate"  # Alternatives: "Georgia", "Copperplate", "Palatino"
-        
         # Display team name at top instead of "DRAFTED"
         if team_id:
             self.scale_canvas.create_text(
                 w/2, box_y - 25,
                 text=f"TEAM {team_id.upper()}",
                 fill="#00aaff",
-                font=(grand_font, 
-                    self.wheel_font_size+6, "bold"),
+                font=self._winner_team_font,
                 anchor="center"
             )
         
@@ -420,8 +584,7 @@ class WheelDisplay:
             w/2+2, box_y + box_height/2 + 2,
             text=player_name,
             fill="#000000",
-            font=(name_font, 
-                self.wheel_font_size+12, "bold"),  # Increased size
+            font=self._winner_name_font,
             anchor="center"
         )
         
@@ -429,8 +592,7 @@ class WheelDisplay:
             w/2, box_y + box_height/2,
             text=player_name,
             fill="#ffffff",
-            font=(name_font, 
-                self.wheel_font_size+12, "bold"),  # Increased size
+            font=self._winner_name_font,
             anchor="center"
         )
         
@@ -445,8 +607,7 @@ class WheelDisplay:
                 w/2, details_y,
                 text=f"{mmr} MMR",
                 fill="#ffffff",
-                font=(grand_font, 
-                    self.wheel_font_size, "bold"),  # Smaller size
+                font=self._winner_detail_font,
                 anchor="center"
             )
         
@@ -456,7 +617,6 @@ class WheelDisplay:
                 w/2, details_y + line_height,
                 text=f"{role}",
                 fill="#ffffff",
-                font=(grand_font, 
-                    self.wheel_font_size, "bold"),  # Smaller size
+                font=self._winner_detail_font,
                 anchor="center"
             ) 
\ No newline at end of file
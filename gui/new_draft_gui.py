@@ -1,7 +1,11 @@
 # gui/new_draft_gui.py
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import tkinter.messagebox as messagebox
+import os
+import logging
+from functools import lru_cache
 
 # Import configuration
 from gui.config import load_config
@@ -13,8 +17,32 @@ from gui.components.probability_view import ProbabilityView, SigmoidChartView
 from gui.components.role_panel import RolePanel, RoleListPanel
 from gui.components.control_panel import ControlPanel, BannerPanel
 
-# Import the chart classes
-from gui.charts import MMRBucketChartView, RoleDistributionChartView
+# The bottom chart classes are imported when the charts are first created
+
+log = logging.getLogger(__name__)
+
+@lru_cache(maxsize=8)
+def _cached_load_config(config_file, mtime):
+    """Parse a UI config file once per (path, modification time)"""
+    return load_config(config_file)
+
+
+def _load_ui_config(config_file):
+    """
+    Load the UI config, reusing the parsed file until it changes on disk
+    
+    Args:
+        config_file: Path to the UI config file (optional)
+        
+    Returns:
+        dict: A fresh copy of the configuration that callers may modify
+    """
+    try:
+        mtime = os.path.getmtime(config_file) if config_file else None
+    except OSError:
+        mtime = None
+    return dict(_cached_load_config(config_file, mtime))
+
 
 class DraftGUI:
     """Main Draft GUI class that integrates all components"""
@@ -32,14 +60,25 @@ class DraftGUI:
         self.config = config
         self.logic = logic
         
+        # Keep the window hidden while it is built so Tk lays it out once at the end
+        self.master.withdraw()
+        
         # Load UI configuration
-        self.ui_config = load_config(config.get("ui_config_file"))
+        self.ui_config = _load_ui_config(config.get("ui_config_file"))
         
         # Apply UI configuration from main config if specified
         if "ui_settings" in config:
             for key, value in config["ui_settings"].items():
                 self.ui_config[key] = value
         
+        # Padding multiples used throughout the layout and popups
+        self._pad = self.ui_config["padding"]
+        self._pad2 = self._pad * 2
+        self._pad4 = self._pad * 4
+        
+        # Named fonts by (family, size, weight), see _font
+        self._fonts = {}
+        
         # Configure the root window
         self._configure_window()
         
@@ -53,6 +92,20 @@ class DraftGUI:
         # Internal variables
         self.pick_team = None
         self.pick_role = None
+        self._refresh_pending = False
+        self._preview_pending = False
+        # Charts whose stats went stale while they were hidden behind the banner
+        self._stale_charts = set()
+        # Draft revision the role listboxes were last filled for
+        self._role_lists_revision = None
+        # logic.teams_version the teams dropdown was last filled for
+        self._teams_combo_version = None
+        # (team, role, draft revision) of the preview on screen
+        self._last_preview_key = None
+        # Popup dialogs, built on first use and then hidden/shown again
+        self._fallback_popup = None
+        self._team_popup = None
+        self._captain_popup = None
         
         # Set up the main layout
         self._create_main_layout()
@@ -69,6 +122,10 @@ class DraftGUI:
         # Initial refresh of data
         self.refresh_all()
         
+        # Show the fully built window
+        self.master.update_idletasks()
+        self.master.deiconify()
+        
         # Set initial pane sizes
         self.master.update()
         left_sash_pos = int(self.ui_config["min_window_width"] * 0.25)  # 25% of min width
@@ -76,6 +133,9 @@ class DraftGUI:
         self.main_paned.sashpos(0, left_sash_pos)
         self.main_paned.sashpos(1, center_sash_pos)
         
+        # Build the bottom charts once the window has painted
+        self.master.after(500, self._init_charts_deferred)
+        
     def _configure_window(self):
         """Configure the root window"""
         self.master.title("WildCards Drafter - Built by Chraos")
@@ -92,38 +152,58 @@ class DraftGUI:
         """Configure ttk styles based on UI config"""
         style = ttk.Style()
         
+        # Named fonts are created once and shared by every widget using the style
+        self._fnt_tree = self._font(self.ui_config["text_font_type"], self.ui_config["tree_font_size"])
+        self._fnt_tree_header = self._font(self.ui_config["text_font_type"], self.ui_config["tree_header_font_size"])
+        self._fnt_button = self._font(self.ui_config["text_font_type"], self.ui_config["button_font_size"])
+        self._fnt_role_button = self._font(self.ui_config["role_button_font_type"], self.ui_config["role_button_font_size"])
+        
         # Treeview styles
         style.configure("Treeview",
-                        font=(self.ui_config["text_font_type"], 
-                              self.ui_config["tree_font_size"], "bold"),
+                        font=self._fnt_tree,
                         rowheight=28)
         style.configure("Treeview.Heading",
-                        font=(self.ui_config["text_font_type"], 
-                              self.ui_config["tree_header_font_size"], "bold"))
+                        font=self._fnt_tree_header)
         
         # Button styles
         style.configure("Normal.TButton",
-                        font=(self.ui_config["text_font_type"], 
-                              self.ui_config["button_font_size"], "bold"),
+                        font=self._fnt_button,
                         padding=0,
                         foreground=self.ui_config["button_fg_color"])
         
         # Role button styles - using specific role button settings
         style.configure("Default.RoleButton.TButton", 
-                        font=(self.ui_config["role_button_font_type"], 
-                              self.ui_config["role_button_font_size"], 
-                              "bold"),
+                        font=self._fnt_role_button,
                         padding=self.ui_config["role_button_padding"],
                         width=self.ui_config["role_button_width"])
                         
         style.configure("Selected.RoleButton.TButton", 
-                        font=(self.ui_config["role_button_font_type"], 
-                              self.ui_config["role_button_font_size"], 
-                              "bold"),
+                        font=self._fnt_role_button,
                         padding=self.ui_config["role_button_padding"],
                         width=self.ui_config["role_button_width"],
                         background=self.ui_config["button_select_color"])
         
+    def _font(self, family, size, weight="bold"):
+        """
+        Get a named font, creating it once per (family, size, weight)
+        
+        Args:
+            family: Font family
+            size: Font size
+            weight: Font weight
+            
+        Returns:
+            tkfont.Font: Shared named font
+        """
+        key = (family, size, weight)
+        fnt = self._fonts.get(key)
+        if fnt is None:
+            fnt = tkfont.Font(root=self.master, family=family, size=size, weight=weight)
+            # Resolve the font now rather than on first use by a widget
+            fnt.metrics()
+            self._fonts[key] = fnt
+        return fnt
+    
     def _create_main_layout(self):
         """Create the main layout with panels"""
         # Use PanedWindow for main layout to allow resizing
@@ -150,7 +230,7 @@ class DraftGUI:
         
         # Scale and probability frame - use PanedWindow for resizable sections
         self.scale_prob_frame = ttk.PanedWindow(self.center_frame, orient=tk.HORIZONTAL)
-        self.scale_prob_frame.grid(row=1, column=0, sticky="nsew", pady=self.ui_config["padding"])
+        self.scale_prob_frame.grid(row=1, column=0, sticky="nsew", pady=self._pad)
 
         # Use frame for scale to allow proper resizing
         self.scale_frame = tk.Frame(self.scale_prob_frame, bg=self.ui_config["frame_bg_color"])
@@ -167,7 +247,7 @@ class DraftGUI:
         
         # Bottom charts frame - make horizontal PanedWindow for left/right division
         self.bottom_charts_frame = ttk.PanedWindow(self.center_frame, orient=tk.HORIZONTAL)
-        self.bottom_charts_frame.grid(row=2, column=0, sticky="nsew", pady=self.ui_config["padding"])
+        self.bottom_charts_frame.grid(row=2, column=0, sticky="nsew", pady=self._pad)
         
         # Left side will contain the vertical stacked charts
         self.left_charts_frame = ttk.PanedWindow(self.bottom_charts_frame, orient=tk.VERTICAL)
@@ -211,7 +291,7 @@ class DraftGUI:
         self.control_panel.set_banner_toggle_command(self.toggle_banner)
         
         # Role Panel component
-        self.role_panel = RolePanel(self.center_frame, self.ui_config, self.preview_slices)
+        self.role_panel = RolePanel(self.center_frame, self.ui_config, self._request_preview)
         self.role_panel.create_role_buttons(self.control_panel.top_controls_frame_1)
         
         # Role List Panel component
@@ -230,25 +310,51 @@ class DraftGUI:
         # Team Panel component
         self.team_panel = TeamPanel(self.right_frame, self.ui_config, self.on_team_selected)
         
-        # Create chart objects
-        self.mmr_chart = MMRBucketChartView(
-            self.mmr_bucket_chart_frame,
-            width=self.ui_config["mmr_chart_width"],
-            height=self.ui_config["mmr_chart_height"],
-            text_font=(self.ui_config["text_font_type"], self.ui_config["text_font_size"], "bold")
-        )
-        
-        self.role_chart = RoleDistributionChartView(
-            self.role_chart_frame,
-            width=self.ui_config["role_chart_width"],
-            height=self.ui_config["role_chart_height"],
-            text_font=(self.ui_config["text_font_type"], self.ui_config["text_font_size"], "bold")
-        )
+        # The bottom charts are created on first use (see mmr_chart/role_chart)
+        self._mmr_chart = None
+        self._role_chart = None
         
         # Banner Panel component
         self.banner_panel = BannerPanel(self.center_frame, self.ui_config)
         self.banner_panel.setup_banner()
     
+    @property
+    def mmr_chart(self):
+        """MMR bucket chart, created on first access"""
+        if self._mmr_chart is None:
+            from gui.charts import MMRBucketChartView
+            self._mmr_chart = MMRBucketChartView(
+                self.mmr_bucket_chart_frame,
+                width=self.ui_config["mmr_chart_width"],
+                height=self.ui_config["mmr_chart_height"],
+                text_font=self._font(self.ui_config["text_font_type"], self.ui_config["text_font_size"])
+            )
+            self._mmr_chart.set_suspended(self.banner_visible.get())
+        return self._mmr_chart
+    
+    @property
+    def role_chart(self):
+        """Role distribution chart, created on first access"""
+        if self._role_chart is None:
+            from gui.charts import RoleDistributionChartView
+            self._role_chart = RoleDistributionChartView(
+                self.role_chart_frame,
+                width=self.ui_config["role_chart_width"],
+                height=self.ui_config["role_chart_height"],
+                text_font=self._font(self.ui_config["text_font_type"], self.ui_config["text_font_size"])
+            )
+            self._role_chart.set_suspended(self.banner_visible.get())
+        return self._role_chart
+    
+    def _init_charts_deferred(self):
+        """Create the bottom charts if needed and draw the ones that went stale"""
+        # Accessing the properties creates the charts
+        _ = self.mmr_chart, self.role_chart
+        if "mmr" in self._stale_charts:
+            self.draw_mmr_bucket_chart()
+        if "role" in self._stale_charts:
+            self.draw_role_chart()
+    
     def on_team_selected(self, team_id):
         """
         Handle team selection
@@ -258,70 +364,134 @@ class DraftGUI:
         """
         self.control_panel.set_selected_team(team_id)
         # Trigger preview to update
-        self.preview_slices()
+        self._request_preview()
     
     def toggle_banner(self):
         """Toggle banner visibility"""
+        # Charts covered by the banner defer their drawing until it is hidden again
+        covered = self.banner_visible.get()
+        for chart in (self.sigmoid_chart, self._mmr_chart, self._role_chart):
+            if chart is not None:
+                chart.set_suspended(covered)
+        
+        # Catch up on the charts that are not created yet or skipped updates while hidden
+        if not covered:
+            self._init_charts_deferred()
+        
         if self.banner_visible.get():
             # Show banner as an overlay on top of the charts
             self.banner_panel.show({"row": 2, "column": 0, "sticky": "nsew"})
-            print("[INFO] Banner displayed (covering charts)")
+            log.debug("Banner displayed (covering charts)")
         else:
             # Hide banner to reveal charts
             self.banner_panel.hide()
-            print("[INFO] Banner hidden (charts visible)")
+            log.debug("Banner hidden (charts visible)")
         
         # Force update to ensure layout changes take effect
         self.master.update_idletasks()
     
     # REFRESH METHODS
+    def _request_refresh(self):
+        """Schedule a refresh_all, coalescing repeated requests into one idle callback"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.master.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the pending refresh scheduled by _request_refresh"""
+        self._refresh_pending = False
+        self.refresh_all()
+
+    def _request_preview(self):
+        """Schedule preview_slices, coalescing rapid team/role changes into one idle callback"""
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        self.master.after_idle(self._do_preview)
+
+    def _do_preview(self):
+        """Run the pending preview scheduled by _request_preview"""
+        self._preview_pending = False
+        self.preview_slices()
+
     def refresh_all(self):
         """Refresh all display elements"""
-        self.refresh_teams_combo()
+        # Fetch the teams once and hand them to every panel that shows them
+        teams_data = self.logic.get_teams_data()
+        self.refresh_teams_combo(teams_data)
         self.refresh_roles_listboxes()
-        self.refresh_teams_display()
+        self.refresh_teams_display(teams_data)
         self.draw_mmr_bucket_chart()
         self.draw_role_chart()
 
-    def refresh_teams_combo(self):
+    def refresh_teams_combo(self, teams_data=None):
         """Update teams dropdown"""
-        teams = list(self.logic.get_teams_data().keys())
+        # Only rebuild the values when teams were added or replaced
+        if self._teams_combo_version == self.logic.teams_version:
+            return
+        self._teams_combo_version = self.logic.teams_version
+        if teams_data is None:
+            teams_data = self.logic.get_teams_data()
+        teams = list(teams_data)
         self.control_panel.update_team_combo(teams)
 
     def refresh_roles_listboxes(self):
         """Update role listboxes with current players"""
+        # The lists only depend on the draft state; skip if it has not changed
+        if self._role_lists_revision == self.logic.revision:
+            return
+        self._role_lists_revision = self.logic.revision
         p_by_role = self.logic.get_players_by_role()
         self.role_list_panel.update_role_lists(p_by_role, self.logic.all_players)
 
-    def refresh_teams_display(self):
+    def refresh_teams_display(self, all_teams=None):
         """Refresh the teams display in right panel"""
-        all_teams = self.logic.get_teams_data()
+        if all_teams is None:
+            all_teams = self.logic.get_teams_data()
         current_team = self.control_panel.get_selected_team()
         self.team_panel.refresh_teams_display(all_teams, current_team)
     
     # CHART METHODS
     def draw_mmr_bucket_chart(self):
         """Draw the MMR bucket chart"""
+        if self._mmr_chart is None or self._mmr_chart.suspended:
+            # Not created yet or hidden behind the banner; stats are gathered once it is shown
+            self._stale_charts.add("mmr")
+            return
+        self._stale_charts.discard("mmr")
         stats = self.logic.get_mmr_bucket_stats()
         self.mmr_chart.draw(stats, self.logic.all_players, self.logic)
 
     def draw_role_chart(self):
         """Draw the role distribution chart"""
+        if self._role_chart is None or self._role_chart.suspended:
+            # Not created yet or hidden behind the banner; stats are gathered once it is shown
+            self._stale_charts.add("role")
+            return
+        self._stale_charts.discard("role")
         stats = self.logic.get_role_distribution_stats()
         self.role_chart.draw(stats, self.logic)
-    
+
     # PREVIEW / SPIN METHODS
     def preview_slices(self):
-        """Preview probability slices for current team and role"""
+        """
+        Preview probability slices for current team and role
+        
+        Skipped when team, role and draft revision are the same as for the
+        preview already on screen.
+        """
+        logic = self.logic
+        players_by_role = logic.players_by_role
         team_id = self.control_panel.get_selected_team()
         self.team_id = team_id
         role = self.role_panel.get_selected_role()
         
-        if team_id not in self.logic.get_teams_data():
+        if team_id not in logic.get_teams_data():
             return
 
         # Check if role is empty
-        if role in self.logic.players_by_role and not self.logic.players_by_role[role]:
+        if role in players_by_role and not players_by_role[role]:
             fallback_role = self.ask_for_fallback_role(role)
             if not fallback_role:
                 return
@@ -329,41 +499,63 @@ class DraftGUI:
         else:
             actual_role = role
 
-        # Calculate randomness
-        base_random = self._get_base_randomness(team_id)
-        self.control_panel.update_randomness_label(base_random)
+        preview_key = (team_id, actual_role, logic.revision)
+        if preview_key == self._last_preview_key:
+            return
+        self._last_preview_key = preview_key
 
-        # Gather 'ideal_mmr' for display
-        ideal_mmr = self.logic.get_ideal_mmr_for_pick(team_id, actual_role)
+        preview = self._compute_preview(team_id, actual_role)
+        self._draw_preview(preview)
 
-        # Show pool vs drafted MMR averages
-        pool_avg = self.logic.get_pool_average_mmr()
-        drafted_avg = self.logic.get_drafted_average_mmr()
-        self.control_panel.update_stats_label(pool_avg, drafted_avg)
+    def _compute_preview(self, team_id, actual_role):
+        """
+        Gather everything the preview shows, without touching any widget
+        
+        Args:
+            team_id: Team to preview the pick for
+            actual_role: Role to pick for (after fallback)
+            
+        Returns:
+            dict: Randomness, ideal MMR, MMR averages, probabilities and lookups
+        """
+        logic = self.logic
+        return {
+            "base_random": self._get_base_randomness(team_id),
+            # Gather 'ideal_mmr' for display
+            "ideal_mmr": logic.get_ideal_mmr_for_pick(team_id, actual_role),
+            # Show pool vs drafted MMR averages
+            "pool_avg": logic.get_pool_average_mmr(),
+            "drafted_avg": logic.get_drafted_average_mmr(),
+            "probs": logic.compute_probabilities(team_id, actual_role),
+            # Player -> MMR and player -> preference for the current role; both are
+            # cached per draft revision and only looked up by the probability view
+            "player_mmrs": logic.get_mmr_view(),
+            "role_prefs": logic.get_role_preferences(actual_role)
+        }
+
+    def _draw_preview(self, preview):
+        """
+        Show a computed preview on the labels, wheel, table and sigmoid chart
+        
+        Args:
+            preview: Result of _compute_preview
+        """
+        self.control_panel.update_randomness_label(preview["base_random"])
+        self.control_panel.update_stats_label(preview["pool_avg"], preview["drafted_avg"])
 
-        # Calculate probabilities
-        probs = self.logic.compute_probabilities(team_id, actual_role)
+        probs = preview["probs"]
         if not probs:
             self.wheel_display.clear()
             self.sigmoid_chart.clear()
             self.probability_view.clear()
             return
-            
-        # Build role preferences mapping for current role
-        role_prefs = {}
-        for player in probs.keys():
-            for role_info in self.logic.all_players[player]["roles"]:
-                if role_info[0] == actual_role:
-                    role_prefs[player] = role_info[1]
-                    break
-            if player not in role_prefs:
-                role_prefs[player] = 1  # Default preference
-
-        # Process probabilities
-        player_mmrs = {p: self.logic.all_players[p]["mmr"] for p in probs.keys()}
+        
+        ideal_mmr = preview["ideal_mmr"]
         
         # Update probability view
-        self.probability_view.update_probabilities(probs, player_mmrs, ideal_mmr, role_prefs)
+        self.probability_view.update_probabilities(
+            probs, preview["player_mmrs"], ideal_mmr, preview["role_prefs"]
+        )
         
         # Build segments and draw wheel
         segments = self.wheel_display.build_segments(probs)
@@ -388,40 +580,87 @@ class DraftGUI:
         Returns:
             str: Selected fallback role or None if cancelled
         """
+        dialog = self._get_fallback_popup()
+        if dialog["open"]:
+            # Already waiting on the shared dialog; a nested wait would take over its answer
+            dialog["window"].lift()
+            return None
+        dialog["label"].config(text=f"No players left for role: {original_role}. Select fallback:")
+        dialog["combo"]["values"] = list(self.logic.players_by_role)
+        dialog["var"].set("")
+        dialog["choice"] = None
+        dialog["done"].set(False)
+        
+        dialog["window"].deiconify()
+        dialog["window"].lift()
+        dialog["open"] = True
+        try:
+            dialog["window"].wait_variable(dialog["done"])
+        finally:
+            dialog["open"] = False
+        return dialog["choice"]
+
+    def _get_fallback_popup(self):
+        """
+        Build the fallback role dialog on first use; later calls reuse the hidden window
+        
+        Returns:
+            dict: Dialog window, widgets and state
+        """
+        if self._fallback_popup is not None:
+            return self._fallback_popup
+        
         popup = tk.Toplevel(self.master)
+        popup.withdraw()
         popup.title("Empty Role Pool")
-        tk.Label(popup, text=f"No players left for role: {original_role}. Select fallback:").pack(pady=self.ui_config["padding"])
+        label = tk.Label(popup)
+        label.pack(pady=self._pad)
         fallback_var = tk.StringVar()
-        fallback_combo = ttk.Combobox(popup, textvariable=fallback_var,
-                                    values=list(self.logic.players_by_role.keys()))
-        fallback_combo.pack(pady=self.ui_config["padding"])
+        fallback_combo = ttk.Combobox(popup, textvariable=fallback_var)
+        fallback_combo.pack(pady=self._pad)
+        
+        dialog = {
+            "window": popup,
+            "label": label,
+            "var": fallback_var,
+            "combo": fallback_combo,
+            "choice": None,
+            "done": tk.BooleanVar(value=False),
+            # True while ask_for_fallback_role is waiting on this dialog
+            "open": False
+        }
 
-        choice = [None]
         def confirm():
             chosen = fallback_var.get()
             if chosen and chosen in self.logic.players_by_role:
-                choice[0] = chosen
-            popup.destroy()
+                dialog["choice"] = chosen
+            popup.withdraw()
+            dialog["done"].set(True)
 
         def cancel():
-            popup.destroy()
+            popup.withdraw()
+            dialog["done"].set(True)
 
-        ttk.Button(popup, text="OK", command=confirm).pack(side=tk.LEFT, padx=self.ui_config["padding"]*4, pady=self.ui_config["padding"]*2)
-        ttk.Button(popup, text="Cancel", command=cancel).pack(side=tk.RIGHT, padx=self.ui_config["padding"]*4, pady=self.ui_config["padding"]*2)
+        ttk.Button(popup, text="OK", command=confirm).pack(side=tk.LEFT, padx=self._pad4, pady=self._pad2)
+        ttk.Button(popup, text="Cancel", command=cancel).pack(side=tk.RIGHT, padx=self._pad4, pady=self._pad2)
+        # Closing the window only hides it so it can be shown again
+        popup.protocol("WM_DELETE_WINDOW", cancel)
 
-        popup.wait_window()
-        return choice[0]
+        self._fallback_popup = dialog
+        return dialog
 
     def spin_clicked(self):
         """Handle spin button click"""
+        logic = self.logic
+        players_by_role = logic.players_by_role
         team_id = self.control_panel.get_selected_team()
         role = self.role_panel.get_selected_role()
         
-        if team_id not in self.logic.get_teams_data():
+        if team_id not in logic.get_teams_data():
             return
 
         # Check if role is empty and ask for fallback
-        if role in self.logic.players_by_role and not self.logic.players_by_role[role]:
+        if role in players_by_role and not players_by_role[role]:
             fallback_role = self.ask_for_fallback_role(role)
             if not fallback_role:
                 return
@@ -434,7 +673,7 @@ class DraftGUI:
         self.control_panel.update_randomness_label(base_random)
 
         # Calculate probabilities and build wheel segments
-        probs = self.logic.compute_probabilities(team_id, actual_role_to_spin)
+        probs = logic.compute_probabilities(team_id, actual_role_to_spin)
         if not probs:
             return
 
@@ -460,105 +699,137 @@ class DraftGUI:
         Args:
             final_position: Final pointer position (0-100)
         """
-        chosen = self.logic.pick_player_from_position(
-            self.pick_team, self.pick_role, final_position, 
-            self.wheel_display.scale_segments
+        logic = self.logic
+        wheel = self.wheel_display
+        pick_team = self.pick_team
+        pick_role = self.pick_role
+        
+        chosen = logic.pick_player_from_position(
+            pick_team, pick_role, final_position, 
+            wheel.scale_segments
         )
         
         if chosen:
             # Get color for winner display
-            player_color = self.wheel_display.player_colors.get(chosen, "red")
+            player_color = wheel.player_colors.get(chosen, "red")
             
             # Get player's MMR
-            player_mmr = self.logic.all_players[chosen]["mmr"]
+            player_mmr = logic.all_players[chosen].mmr
             
             # Get formatted position (role)
             # Try to get role number mapping if available
-            role_display = self.pick_role
-            if hasattr(self.logic, 'role_to_number') and self.pick_role in self.logic.role_to_number:
-                role_display = f"{self.pick_role} (Pos {self.logic.role_to_number[self.pick_role]})"
+            role_display = pick_role
+            role_to_number = getattr(logic, 'role_to_number', None)
+            if role_to_number and pick_role in role_to_number:
+                role_display = f"{pick_role} (Pos {role_to_number[pick_role]})"
             
             # Display winner with all details
-            self.wheel_display.display_winner(
+            wheel.display_winner(
                 chosen, 
                 player_color,
-                team_id=self.pick_team,
+                team_id=pick_team,
                 mmr=player_mmr,
                 role=role_display
             )
             
+        # The wheel no longer shows the preview; the next one must redraw it
+        self._last_preview_key = None
+        
         # Refresh all data
-        self.refresh_all()
+        self._request_refresh()
     
     # TEAM AND PLAYER MANAGEMENT METHODS
     def create_team_popup(self):
         """Open popup to create a new team"""
-        popup = tk.Toplevel(self.master)
-        popup.title("Create New Team")
-        tk.Label(popup, text="Team Name:").pack(side=tk.TOP, pady=self.ui_config["padding"])
-        name_var = tk.StringVar()
-        entry = tk.Entry(popup, textvariable=name_var)
-        entry.pack(side=tk.TOP, pady=self.ui_config["padding"])
-        
-        def confirm():
-            tname = name_var.get().strip()
-            if tname:
-                self.logic.register_team(tname)
-                self.refresh_all()
-            popup.destroy()
+        if self._team_popup is None:
+            popup = tk.Toplevel(self.master)
+            popup.withdraw()
+            popup.title("Create New Team")
+            tk.Label(popup, text="Team Name:").pack(side=tk.TOP, pady=self._pad)
+            name_var = tk.StringVar()
+            entry = tk.Entry(popup, textvariable=name_var)
+            entry.pack(side=tk.TOP, pady=self._pad)
             
-        ttk.Button(popup, text="Confirm", style="Normal.TButton", command=confirm).pack(side=tk.TOP, pady=self.ui_config["padding"]*2)
+            def confirm():
+                tname = name_var.get().strip()
+                if tname:
+                    self.logic.register_team(tname)
+                    self._request_refresh()
+                popup.withdraw()
+                
+            ttk.Button(popup, text="Confirm", style="Normal.TButton", command=confirm).pack(side=tk.TOP, pady=self._pad2)
+            # Closing the window only hides it so it can be shown again
+            popup.protocol("WM_DELETE_WINDOW", popup.withdraw)
+            self._team_popup = {"window": popup, "name_var": name_var}
+        
+        self._team_popup["name_var"].set("")
+        self._team_popup["window"].deiconify()
+        self._team_popup["window"].lift()
 
     def add_captain_popup(self):
         """Open popup to add a captain to a team"""
         team_id = self.control_panel.get_selected_team()
         if not team_id:
             return
-            
-        popup = tk.Toplevel(self.master)
-        popup.title(f"Add Captain to {team_id}")
-
-        tk.Label(popup, text="Captain Name:").pack(pady=self.ui_config["padding"])
-        name_var = tk.StringVar()
-        e_name = tk.Entry(popup, textvariable=name_var)
-        e_name.pack(pady=self.ui_config["padding"])
+        
+        if self._captain_popup is None:
+            popup = tk.Toplevel(self.master)
+            popup.withdraw()
 
-        tk.Label(popup, text="Captain MMR:").pack(pady=self.ui_config["padding"])
-        mmr_var = tk.StringVar()
-        e_mmr = tk.Entry(popup, textvariable=mmr_var)
-        e_mmr.pack(pady=self.ui_config["padding"])
+            tk.Label(popup, text="Captain Name:").pack(pady=self._pad)
+            name_var = tk.StringVar()
+            e_name = tk.Entry(popup, textvariable=name_var)
+            e_name.pack(pady=self._pad)
 
-        def confirm():
-            cname = name_var.get().strip()
-            if not cname:
-                popup.destroy()
-                return
-            try:
-                cmmr = int(mmr_var.get())
-            except:
-                cmmr = 0
-            self.logic.add_captain_to_team(team_id, cname, cmmr)
-            self.refresh_all()
-            popup.destroy()
+            tk.Label(popup, text="Captain MMR:").pack(pady=self._pad)
+            mmr_var = tk.StringVar()
+            e_mmr = tk.Entry(popup, textvariable=mmr_var)
+            e_mmr.pack(pady=self._pad)
             
-        ttk.Button(popup, text="Confirm", command=confirm).pack(pady=self.ui_config["padding"]*2)
+            dialog = {"window": popup, "name_var": name_var, "mmr_var": mmr_var, "team_id": None}
+
+            def confirm():
+                cname = name_var.get().strip()
+                if not cname:
+                    popup.withdraw()
+                    return
+                try:
+                    cmmr = int(mmr_var.get())
+                except:
+                    cmmr = 0
+                self.logic.add_captain_to_team(dialog["team_id"], cname, cmmr)
+                self._request_refresh()
+                popup.withdraw()
+                
+            ttk.Button(popup, text="Confirm", command=confirm).pack(pady=self._pad2)
+            # Closing the window only hides it so it can be shown again
+            popup.protocol("WM_DELETE_WINDOW", popup.withdraw)
+            self._captain_popup = dialog
+        
+        dialog = self._captain_popup
+        dialog["team_id"] = team_id
+        dialog["name_var"].set("")
+        dialog["mmr_var"].set("")
+        dialog["window"].title(f"Add Captain to {team_id}")
+        dialog["window"].deiconify()
+        dialog["window"].lift()
     
     # SAVE AND LOAD METHODS
     def undo_pick(self):
         """Undo the last player pick"""
         undone = self.logic.undo_last_pick()
         if undone:
-            print(f"[UNDO] Removed {undone} from team.")
+            log.debug("Undo removed %s from team", undone)
             messagebox.showinfo("Undo", f"Removed {undone} from team.")
         else:
             messagebox.showinfo("Undo", "Nothing to undo.")
-        self.refresh_all()
+        self._request_refresh()
 
     def save_draft(self):
         """Save the current draft state"""
         try:
             self.logic.save_state("data/draft_remaining.csv", "data/draft_teams.csv")
-            print("[GUI] Saved state.")
+            log.debug("Saved state")
             messagebox.showinfo("Save", "Draft state saved successfully.")
         except Exception as e:
             print(f"[ERROR] Failed to save state: {e}")
@@ -568,12 +839,13 @@ class DraftGUI:
         """Load a saved draft state"""
         try:
             self.logic.load_state("data/draft_remaining.csv", "data/draft_teams.csv")
-            print("[GUI] Loaded state.")
+            log.debug("Loaded state")
             messagebox.showinfo("Load", "Draft state loaded successfully.")
-            self.refresh_all()
+            self._request_refresh()
             self.wheel_display.clear()
             self.sigmoid_chart.clear()
             self.probability_view.clear()
+            self._last_preview_key = None
         except Exception as e:
             print(f"[ERROR] Failed to load state: {e}")
             messagebox.showerror("Load Error", f"Failed to load: {str(e)}")
@@ -2,9 +2,74 @@
 
 import csv
 import os
+from sys import intern
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from typing import Dict, List, Any, Optional
 
-from  probability_calc import compute_probabilities
+from  probability_calc import compute_probabilities, build_role_index
+
+# read/write the CSVs in large chunks instead of many small syscalls
+CSV_BUFFER_SIZE = 1 << 20
+
+# MMR buckets of the pool chart: (label, min, max), ordered and non-overlapping
+_MMR_BUCKETS = (
+    ("2k-3.5k", 2000, 3500),
+    ("3.5k-5k", 3501, 5000),
+    ("5k-6.5k", 5001, 6500),
+    ("6.5k-8k", 6501, 8000),
+    (">8000",   8001, 999999),
+)
+_BUCKET_MINS = [b[1] for b in _MMR_BUCKETS]
+# player categories of the pool chart, by index
+_CATEGORY_KEYS = ("core_only", "support_only", "mixed")
+# role groups for core/support categories; the charts import these too
+CORE_ROLES = frozenset({"carry","mid","offlane"})
+SUPPORT_ROLES = frozenset({"soft_support","hard_support"})
+
+
+def _mmr_bucket_index(mmr: int) -> int:
+    """
+    Index into _MMR_BUCKETS for this MMR, or -1 if it falls outside every bucket.
+    """
+    pos = bisect_right(_BUCKET_MINS, mmr) - 1
+    if pos < 0 or mmr > _MMR_BUCKETS[pos][2]:
+        return -1
+    return pos
+
+
+def _role_category(roles_map: Dict[str,int]) -> int:
+    """
+    Index into _CATEGORY_KEYS: core roles only, support roles only, or mixed/none.
+    """
+    roles = roles_map.keys()
+    if not roles:
+        return 2
+    if roles <= CORE_ROLES:
+        return 0
+    if roles <= SUPPORT_ROLES:
+        return 1
+    return 2
+
+class PlayerRec:
+    """
+    One player: MMR, [(roleName, priority), ...], {roleName: priority},
+    the names of the (up to) two highest-priority roles
+    and the roles as saved to CSV, e.g. "carry(1)|mid(2)".
+    """
+    __slots__ = ("mmr", "roles", "roles_map", "top_roles", "roles_str")
+
+    def __init__(self, mmr: int, roles: List[tuple]):
+        self.mmr = mmr
+        self.roles = roles
+        # a role listed twice keeps its first priority, as a scan over roles would
+        roles_map = {}
+        for (rn, prio) in roles:
+            roles_map.setdefault(rn, prio)
+        self.roles_map = roles_map
+        self.top_roles = frozenset(rn for (rn, prio) in sorted(roles, key=lambda x: x[1])[:2])
+        self.roles_str = "|".join(f"{rn}({prio})" for (rn, prio) in roles)
+
 
 class DraftLogic:
     """
@@ -21,7 +86,7 @@ class DraftLogic:
         # config values
         self.global_average_mmr = config.get("global_average_mmr", 6000)
         self.player_data_csv = config.get("player_data_csv", "players_data.csv")
-        self.roles = config.get("roles", ["carry","mid","offlane","soft_support","hard_support"])
+        self.roles = [intern(r) for r in config.get("roles", ["carry","mid","offlane","soft_support","hard_support"])]
         self.randomness_levels = config.get("randomness_levels", {})
         
         # Example: read logistic settings safely
@@ -29,6 +94,10 @@ class DraftLogic:
         self.logistic_midpoint = logistic_cfg.get("midpoint")
         self.logistic_slope = logistic_cfg.get("slope")
         self.blend_alpha = logistic_cfg.get("blend_alpha", 0.7)
+        # (team_size, role_preference_weights, midpoint, slope, blend_alpha) for compute_probabilities
+        self._probability_settings: Optional[tuple] = None
+        # role -> {player: (mmr, preference factor > 0)}, see build_role_index; rebuilt after a (re)load
+        self._role_index: Optional[Dict[str, Dict[str, tuple]]] = None
 
         # role -> number for display
         self.role_to_number = {
@@ -40,16 +109,34 @@ class DraftLogic:
         }
 
         # data structures
-        self.players_by_role: Dict[str, List[str]] = {r:[] for r in self.roles}
-        # all_players[name] = {"mmr":int, "roles":[(roleName,priority), ...]}
-        self.all_players: Dict[str,Dict[str,Any]] = {}
+        # role -> {playerName: None}; an insertion-ordered set, so picks remove in O(1)
+        self.players_by_role: Dict[str, Dict[str, None]] = {r:{} for r in self.roles}
+        # all_players[name] = PlayerRec(mmr, [(roleName,priority), ...])
+        self.all_players: Dict[str,PlayerRec] = {}
         # teams[team_id] = {
         #   "players":[(playerName, roleAssigned)],
+        #   "mmr_sum":int,
         #   "average_mmr":float
         # }
         self.teams: Dict[str,Dict[str,Any]] = {}
         # draft history => for undo
         self.draft_history: List[Dict[str,Any]] = []
+        # names of every player currently on some team
+        self._drafted_set: set = set()
+        # role -> players sorted by MMR desc; only roles in _sorted_dirty get re-sorted
+        self._sorted_cache: Dict[str, List[str]] = {}
+        self._sorted_dirty: set = set(self.roles)
+        # role -> [MMR sum, Counter(priority -> players)] over the players in players_by_role[role],
+        # kept in step with every insert/remove so the role stats need no rescan
+        self._role_totals: Dict[str, list] = {}
+        # sorted tuple of every role key in players_by_role, see _all_roles_sorted
+        self._all_roles_cache: Optional[tuple] = None
+
+        # bumped on every change to players/teams; derived values are cached per revision
+        self._draft_revision: int = 0
+        self._revision_cache: Dict[tuple, Any] = {}
+        # bumped only when the set of teams changes (added, or cleared on load)
+        self.teams_version: int = 0
 
         self.load_player_data()
 
@@ -62,31 +149,77 @@ class DraftLogic:
         self.all_players.clear()
         for r in self.players_by_role:
             self.players_by_role[r].clear()
+        self._role_totals.clear()
+        self._sorted_dirty.update(self.players_by_role)
         self.teams.clear()
+        self.teams_version += 1
         self.draft_history.clear()
+        self._drafted_set.clear()
+        self._role_index = None
 
         try:
-            with open(self.player_data_csv, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    name = row["name"].strip()
-                    mmr = int(row["mmr"])
-                    roles_str = row["roles"].strip()  # e.g. carry(1)|mid(2)
-
-                    parsed_roles = self._parse_roles_with_priority(roles_str)
-                    self.all_players[name] = {"mmr": mmr, "roles": parsed_roles}
-
-                    # add to players_by_role
-                    for (rname, prio) in parsed_roles:
-                        if rname not in self.players_by_role:
-                            self.players_by_role[rname] = []
-                        self.players_by_role[rname].append(name)
-
+            self._read_players_csv(self.player_data_csv)
             print(f"[LOAD] Player data loaded from '{self.player_data_csv}'.")
         except FileNotFoundError:
             print(f"[ERROR] CSV not found at '{self.player_data_csv}'.")
         except Exception as e:
             print(f"[ERROR] Could not load player data: {e}")
+        self._bump_revision()
+
+    def _read_players_csv(self, path: str):
+        """
+        Add every row of a name/mmr/roles CSV to all_players and players_by_role.
+        """
+        players = self.all_players
+        parse_roles = self._parse_roles_with_priority
+        # names in file order; a name repeated in the file keeps its first place
+        read_names: Dict[str, None] = {}
+
+        with open(path, "r", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as csvfile:
+            reader = csv.reader(csvfile)
+            # column positions from the header, then plain list rows
+            header = next(reader, [])
+            name_idx = header.index("name")
+            mmr_idx = header.index("mmr")
+            roles_idx = header.index("roles")
+            for row in reader:
+                if not row:
+                    continue
+                name = intern(row[name_idx].strip())
+                mmr = int(row[mmr_idx])
+                parsed_roles = parse_roles(row[roles_idx].strip())  # e.g. carry(1)|mid(2)
+
+                players[name] = PlayerRec(mmr, parsed_roles)
+                read_names[name] = None
+
+        # role -> {name: None}, taken from each name's final record so a later row
+        # for the same name replaces the roles of an earlier one
+        by_role = defaultdict(dict)
+        for name in read_names:
+            for (rname, prio) in players[name].roles:
+                by_role[rname][name] = None
+
+        # configured roles keep their place; roles only seen in the file are appended
+        for rname, members in by_role.items():
+            rplayers = self.players_by_role.setdefault(rname, {})
+            for name in members:
+                if name not in rplayers:
+                    rplayers[name] = None
+                    self._update_role_totals(rname, players[name], 1)
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter bumped by every change to players, teams or picks.
+        """
+        return self._draft_revision
+
+    def _bump_revision(self):
+        """
+        Mark the draft state as changed, dropping values cached for the old revision.
+        """
+        self._draft_revision += 1
+        self._revision_cache.clear()
 
     def _parse_roles_with_priority(self, roles_str: str) -> List[tuple]:
         """
@@ -95,43 +228,49 @@ class DraftLogic:
         """
         if not roles_str:
             return []
-        parts = roles_str.split("|")
         result = []
-        for part in parts:
+        for part in roles_str.split("|"):
             part = part.strip()
-            if "(" in part and ")" in part:
-                idx1 = part.index("(")
-                idx2 = part.index(")")
-                rname = part[:idx1].strip()
-                prio_str = part[idx1+1:idx2].strip()
-                try:
-                    prio = int(prio_str)
-                except:
-                    prio=1
-                result.append((rname, prio))
-            else:
-                result.append((part, 1))
+            idx1 = part.find("(")
+            idx2 = part.find(")")
+            if idx1 < 0 or idx2 < 0:
+                result.append((intern(part), 1))
+                continue
+            prio_str = part[idx1+1:idx2].strip()
+            try:
+                prio = int(prio_str)
+            except ValueError:
+                prio = 1
+            result.append((intern(part[:idx1].strip()), prio))
         return result
 
     def register_team(self, team_id: str):
         if team_id not in self.teams:
-            self.teams[team_id] = {
+            self.teams[intern(team_id)] = {
                 "players": [],
+                "mmr_sum": 0,
                 "average_mmr": 0.0
             }
+            self.teams_version += 1
+            self._bump_revision()
 
     def get_teams_data(self) -> Dict[str, Dict[str,Any]]:
         return self.teams
 
+    def _all_roles_sorted(self) -> tuple:
+        """
+        Every role with a players_by_role entry, sorted; rebuilt only when roles are added.
+        """
+        roles = self._all_roles_cache
+        if roles is None or len(roles) != len(self.players_by_role):
+            roles = self._all_roles_cache = tuple(sorted(self.players_by_role))
+        return roles
+
     def get_unfilled_roles_for_team(self, team_id: str) -> List[str]:
         if team_id not in self.teams:
             return []
-        assigned=set()
-        for (p, role) in self.teams[team_id]["players"]:
-            if role in self.role_to_number:
-                assigned.add(role)
-        all_r=set(self.players_by_role.keys())
-        return sorted(list(all_r - assigned))
+        assigned={role for (p, role) in self.teams[team_id]["players"] if role in self.role_to_number}
+        return [r for r in self._all_roles_sorted() if r not in assigned]
 
     def compute_probabilities(self, team_id: str, role: str) -> Dict[str,float]:
         if team_id not in self.teams:
@@ -139,6 +278,11 @@ class DraftLogic:
         if role not in self.players_by_role:
             return {}
 
+        # preview and spin ask for the same team/role until the next pick or undo
+        key = ("probabilities", team_id, role)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+
         team_data = self.teams[team_id]
         players_in_role = self.players_by_role[role]
         if not players_in_role:
@@ -147,26 +291,52 @@ class DraftLogic:
         n = len(team_data["players"])
         base_rand = self.randomness_levels.get(n, 0.30)
 
-        return compute_probabilities(
+        # nested config values are resolved on the first call, then reused
+        settings = self._probability_settings
+        if settings is None:
+            logistic_cfg = self.config["logistic_settings"]
+            settings = self._probability_settings = (
+                self.config["team_size"],
+                self.config["role_preference_weights"],
+                logistic_cfg["midpoint"],
+                logistic_cfg["slope"],
+                logistic_cfg["blend_alpha"],
+            )
+        team_size, pref_weights, midpoint, slope, blend_alpha = settings
+
+        # candidate MMRs and preference factors depend only on the player pool, not on picks
+        role_index = self._role_index
+        if role_index is None:
+            role_index = self._role_index = build_role_index(self.all_players, pref_weights)
+
+        probs = compute_probabilities(
             team_data=team_data,
             role=role,
             all_players=self.all_players,
             players_in_role=players_in_role,
             global_average_mmr=self.global_average_mmr,
             base_randomness=base_rand,
-            team_size=self.config["team_size"],
+            team_size=team_size,
 
             # Extended config:
-            role_preference_weights=self.config["role_preference_weights"],
-            logistic_midpoint=self.config["logistic_settings"]["midpoint"],
-            logistic_slope=self.config["logistic_settings"]["slope"],
-            blend_alpha=self.config["logistic_settings"]["blend_alpha"]
+            role_preference_weights=pref_weights,
+            logistic_midpoint=midpoint,
+            logistic_slope=slope,
+            blend_alpha=blend_alpha,
+            role_candidates=role_index.get(role, {}),
+            # same value for every role this team is offered, cached per revision
+            ideal_mmr=self.get_ideal_mmr_for_pick(team_id, role)
         )
+        self._revision_cache[key] = probs
+        return probs
 
     def pick_player_from_position(self, team_id:str, role:str, position_pct:float, segments:List[tuple]) -> Optional[str]:
-        # segments => [(playerName, startPct, endPct)]
-        for (p, startp, endp) in segments:
-            if position_pct>=startp and position_pct<endp:
+        # segments => [(playerName, startPct, endPct)], contiguous and in increasing order;
+        # the hit is the first segment ending past the position
+        pos = bisect_right([seg[2] for seg in segments], position_pct)
+        if pos < len(segments):
+            p, startp, endp = segments[pos]
+            if position_pct>=startp:
                 self._remove_player(p)
                 self._assign_to_team(team_id, p, role)
                 self.draft_history.append({
@@ -174,19 +344,32 @@ class DraftLogic:
                     "player_name":p,
                     "role":role
                 })
+                self._bump_revision()
                 return p
         return None
 
     def _remove_player(self, p:str):
-        for rlist in self.players_by_role.values():
-            if p in rlist:
-                rlist.remove(p)
+        for rname, rplayers in self.players_by_role.items():
+            if rplayers.pop(p, 0) is None:
+                self._sorted_dirty.add(rname)
+                self._update_role_totals(rname, self.all_players[p], -1)
+
+    def _update_role_totals(self, rname:str, info:PlayerRec, sign:int):
+        """
+        Add (sign=1) or remove (sign=-1) one player's MMR and priority in the totals of a role.
+        """
+        totals=self._role_totals.get(rname)
+        if totals is None:
+            totals=self._role_totals[rname]=[0, Counter()]
+        totals[0]+=sign*info.mmr
+        totals[1][info.roles_map[rname]]+=sign
 
     def _assign_to_team(self, team_id:str, pname:str, role:str):
         tdata=self.teams[team_id]
         tdata["players"].append((pname, role))
-        mmr_sum = sum(self.all_players[x]["mmr"] for (x,rr) in tdata["players"])
-        tdata["average_mmr"] = mmr_sum/len(tdata["players"])
+        self._drafted_set.add(pname)
+        tdata["mmr_sum"] += self.all_players[pname].mmr
+        tdata["average_mmr"] = tdata["mmr_sum"]/len(tdata["players"])
 
     def undo_last_pick(self):
         if not self.draft_history:
@@ -199,154 +382,165 @@ class DraftLogic:
         tdata=self.teams[tid]
         if (pname,role) in tdata["players"]:
             tdata["players"].remove((pname,role))
+            # the same name may still sit on another team
+            if not any(x == pname for data in self.teams.values() for (x,_) in data["players"]):
+                self._drafted_set.discard(pname)
+            tdata["mmr_sum"]-=self.all_players[pname].mmr
 
         if tdata["players"]:
-            mmr_sum=sum(self.all_players[x]["mmr"] for (x,rr) in tdata["players"])
-            tdata["average_mmr"]= mmr_sum/len(tdata["players"])
+            tdata["average_mmr"]= tdata["mmr_sum"]/len(tdata["players"])
         else:
             tdata["average_mmr"]=0
 
-        # restore
-        for (rname,prio) in self.all_players[pname]["roles"]:
-            if rname not in self.players_by_role:
-                self.players_by_role[rname]=[]
-            self.players_by_role[rname].append(pname)
+        # restore; the loaders created a players_by_role entry for every role a player lists
+        players_by_role=self.players_by_role
+        sorted_dirty=self._sorted_dirty
+        info=self.all_players[pname]
+        for (rname,prio) in info.roles:
+            if pname not in players_by_role[rname]:
+                players_by_role[rname][pname]=None
+                self._update_role_totals(rname, info, 1)
+            sorted_dirty.add(rname)
+        self._bump_revision()
         return pname
 
     def get_players_by_role(self) -> Dict[str,List[str]]:
+        key = ("players_by_role",)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+        players = self.all_players
+        sorted_cache = self._sorted_cache
+        mmr_of = lambda x: players[x].mmr
         res={}
         for r, plist in self.players_by_role.items():
-            # sort by MMR desc
-            s = sorted(plist, key=lambda x: self.all_players[x]["mmr"], reverse=True)
-            res[r]=s
+            if r in self._sorted_dirty or r not in sorted_cache:
+                # sort by MMR desc
+                sorted_cache[r] = sorted(plist, key=mmr_of, reverse=True)
+            res[r]=sorted_cache[r]
+        self._sorted_dirty.clear()
+        self._revision_cache[key] = res
+        return res
+
+    def get_mmr_view(self) -> Dict[str,int]:
+        """
+        player -> MMR for every known player, rebuilt only when the draft changes.
+        """
+        key = ("mmr_view",)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+        res={pname: info.mmr for pname, info in self.all_players.items()}
+        self._revision_cache[key] = res
+        return res
+
+    def get_role_preferences(self, role:str) -> Dict[str,int]:
+        """
+        player -> preference for the given role, for every player listing that role.
+        Built once per role and draft revision.
+        """
+        key = ("role_preferences", role)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+        res={}
+        for pname, info in self.all_players.items():
+            prio = info.roles_map.get(role)
+            if prio is not None:
+                res[pname]=prio
+        self._revision_cache[key] = res
         return res
 
     # Captain
     def add_captain_to_team(self, team_id:str, captain_name:str, captain_mmr:int):
         if team_id not in self.teams:
             self.register_team(team_id)
+        captain_name=intern(captain_name)
         if captain_name not in self.all_players:
-            self.all_players[captain_name]={"mmr":captain_mmr,"roles":[]}
+            self.all_players[captain_name]=PlayerRec(captain_mmr, [])
 
         self.teams[team_id]["players"].append((captain_name,"(Captain)"))
-        mmr_sum= sum(self.all_players[pn]["mmr"] for (pn,r) in self.teams[team_id]["players"])
-        count= len(self.teams[team_id]["players"])
-        self.teams[team_id]["average_mmr"]= mmr_sum/count if count>0 else 0
+        self._drafted_set.add(captain_name)
+        tdata=self.teams[team_id]
+        tdata["mmr_sum"]+=self.all_players[captain_name].mmr
+        count= len(tdata["players"])
+        tdata["average_mmr"]= tdata["mmr_sum"]/count if count>0 else 0
 
         self.draft_history.append({
             "team_id":team_id,
             "player_name":captain_name,
             "role":"(Captain)"
         })
+        self._bump_revision()
 
     # stats for charts
     def get_mmr_bucket_stats(self):
-        # same logic you had before
-        buckets={
-            "2k-3.5k":{"min":2000,"max":3500,"core_only":0,"support_only":0,"mixed":0},
-            "3.5k-5k":{"min":3501,"max":5000,"core_only":0,"support_only":0,"mixed":0},
-            "5k-6.5k":{"min":5001,"max":6500,"core_only":0,"support_only":0,"mixed":0},
-            "6.5k-8k":{"min":6501,"max":8000,"core_only":0,"support_only":0,"mixed":0},
-            ">8000":  {"min":8001,"max":999999,"core_only":0,"support_only":0,"mixed":0}
-        }
-        core_roles={"carry","mid","offlane"}
-        supp_roles={"soft_support","hard_support"}
-
-        assigned=set()
-        for tid,data in self.teams.items():
-            for (p,r) in data["players"]:
-                assigned.add(p)
-
+        key = ("mmr_bucket_stats",)
+        cached = self._revision_cache.get(key)
+        if cached is not None:
+            return cached
+        final_stats={label:{ckey: 0 for ckey in _CATEGORY_KEYS} for (label,_,_) in _MMR_BUCKETS}
+        drafted=self._drafted_set
         for pname,info in self.all_players.items():
-            if pname in assigned:
+            if pname in drafted:
                 continue
-            mmr=info["mmr"]
-            roles_set=set(rn for (rn,prio) in info["roles"])
-
-            bucket_key=None
-            for k,binfo in buckets.items():
-                if binfo["min"] <= mmr <= binfo["max"]:
-                    bucket_key=k
-                    break
-            if not bucket_key:
-                continue
-
-            if not roles_set:
-                buckets[bucket_key]["mixed"]+=1
+            b=_mmr_bucket_index(info.mmr)
+            if b<0:
                 continue
-
-            is_core= roles_set.issubset(core_roles)
-            is_supp= roles_set.issubset(supp_roles)
-            if is_core:
-                buckets[bucket_key]["core_only"]+=1
-            elif is_supp:
-                buckets[bucket_key]["support_only"]+=1
-            else:
-                buckets[bucket_key]["mixed"]+=1
-
-        final_stats={}
-        for k,d in buckets.items():
-            final_stats[k]={
-                "core_only":d["core_only"],
-                "support_only":d["support_only"],
-                "mixed":d["mixed"]
-            }
+            final_stats[_MMR_BUCKETS[b][0]][_CATEGORY_KEYS[_role_category(info.roles_map)]]+=1
+        self._revision_cache[key] = final_stats
         return final_stats
 
     def get_role_distribution_stats(self):
+        key = ("role_distribution_stats",)
+        cached = self._revision_cache.get(key)
+        if cached is not None:
+            return cached
         res={}
         for r, plist in self.players_by_role.items():
-            if not plist:
+            count=len(plist)
+            if not count:
                 res[r]=(0,0)
                 continue
-            mmrs=[ self.all_players[p]["mmr"] for p in plist ]
-            count=len(mmrs)
-            avg=sum(mmrs)/count if count else 0
-            res[r]=(count,avg)
+            res[r]=(count, self._role_totals[r][0]/count)
+        self._revision_cache[key] = res
+        return res
+
+    def get_role_priority_counts(self) -> Dict[str, Dict[int,int]]:
+        """
+        role -> {priority: players} for priorities 1-3, over the players still available per role.
+        """
+        res={}
+        for r in self.roles:
+            totals=self._role_totals.get(r)
+            counts=totals[1] if totals is not None else {}
+            res[r]={prio: counts.get(prio, 0) for prio in (1, 2, 3)}
+        # captains join a team but stay listed under their roles; only undrafted players count
+        for name in self._drafted_set:
+            for rname, prio in self.all_players[name].roles_map.items():
+                counts=res.get(rname)
+                if counts is not None and prio in counts and name in self.players_by_role.get(rname, ()):
+                    counts[prio]-=1
         return res
 
     # Save/Load
     def save_state(self, remaining_csv="draft_remaining.csv", teams_csv="draft_teams.csv"):
         print("[SAVE] saving state")
-        assigned=set()
-        for tid,data in self.teams.items():
-            for (p,role) in data["players"]:
-                assigned.add(p)
-
-        with open(remaining_csv,"w",encoding="utf-8",newline="") as rf:
-            writer=csv.DictWriter(rf,fieldnames=["name","mmr","roles"])
-            writer.writeheader()
-            for p,info in self.all_players.items():
-                if p not in assigned:
-                    roles_str=self._roles_to_string(info["roles"])
-                    writer.writerow({
-                        "name":p,
-                        "mmr":info["mmr"],
-                        "roles":roles_str
-                    })
-
-        with open(teams_csv,"w",encoding="utf-8",newline="") as tf:
-            flds=["team_id","name","assigned_role","mmr"]
-            writer=csv.DictWriter(tf,fieldnames=flds)
-            writer.writeheader()
-            for tid,data in self.teams.items():
-                for (p,assigned_role) in data["players"]:
-                    info=self.all_players[p]
-                    writer.writerow({
-                        "team_id":tid,
-                        "name":p,
-                        "assigned_role":assigned_role,
-                        "mmr":info["mmr"]
-                    })
-
-    def _roles_to_string(self, role_list:List[tuple]) -> str:
-        """
-        Convert [("carry",1),("mid",2)] => "carry(1)|mid(2)"
-        """
-        parts=[]
-        for (rn,prio) in role_list:
-            parts.append(f"{rn}({prio})")
-        return "|".join(parts)
+        assigned=self._drafted_set
+        players=self.all_players
+        with open(remaining_csv,"w",encoding="utf-8",newline="",buffering=CSV_BUFFER_SIZE) as rf:
+            writer=csv.writer(rf)
+            writer.writerow(["name","mmr","roles"])
+            writer.writerows(
+                (p, info.mmr, info.roles_str)
+                for p,info in players.items() if p not in assigned
+            )
+
+        with open(teams_csv,"w",encoding="utf-8",newline="",buffering=CSV_BUFFER_SIZE) as tf:
+            writer=csv.writer(tf)
+            writer.writerow(["team_id","name","assigned_role","mmr"])
+            writer.writerows(
+                (tid, p, assigned_role, players[p].mmr)
+                for tid,data in self.teams.items()
+                for (p,assigned_role) in data["players"]
+            )
 
     def load_state(self, remaining_csv="draft_remaining.csv", teams_csv="draft_teams.csv"):
         print("[LOAD] loading state")
@@ -357,52 +551,53 @@ class DraftLogic:
         self.all_players.clear()
         for r in self.players_by_role:
             self.players_by_role[r].clear()
+        self._role_totals.clear()
+        self._sorted_dirty.update(self.players_by_role)
         self.teams.clear()
+        self.teams_version += 1
         self.draft_history.clear()
-
-        with open(remaining_csv,"r",encoding="utf-8") as rf:
-            rr=csv.DictReader(rf)
-            for row in rr:
-                name=row["name"].strip()
-                mmr=int(row["mmr"])
-                roles_str=row["roles"].strip()
-                parsed=self._parse_roles_with_priority(roles_str)
-                self.all_players[name]={"mmr":mmr,"roles":parsed}
-                for (rname,prio) in parsed:
-                    if rname not in self.players_by_role:
-                        self.players_by_role[rname]=[]
-                    self.players_by_role[rname].append(name)
-
-        assigned_data={}
-        with open(teams_csv,"r",encoding="utf-8") as tf:
-            tr=csv.DictReader(tf)
+        self._drafted_set.clear()
+        self._role_index = None
+        self._bump_revision()
+
+        self._read_players_csv(remaining_csv)
+
+        assigned_data=defaultdict(list)
+        with open(teams_csv,"r",encoding="utf-8",newline="",buffering=CSV_BUFFER_SIZE) as tf:
+            tr=csv.reader(tf)
+            header=next(tr,[])
+            tid_idx=header.index("team_id")
+            name_idx=header.index("name")
+            role_idx=header.index("assigned_role")
+            mmr_idx=header.index("mmr")
             for row in tr:
-                tid=row["team_id"].strip()
-                pname=row["name"].strip()
-                assigned_role=row["assigned_role"].strip()
-                pmmr=int(row["mmr"])
-                if tid not in assigned_data:
-                    assigned_data[tid]=[]
+                if not row:
+                    continue
+                tid=intern(row[tid_idx].strip())
+                pname=intern(row[name_idx].strip())
+                assigned_role=intern(row[role_idx].strip())
+                pmmr=int(row[mmr_idx])
                 assigned_data[tid].append((pname,assigned_role,pmmr))
 
         for tid, plist in assigned_data.items():
             self.register_team(tid)
             for (pname, role, pmmr) in plist:
                 if pname not in self.all_players:
-                    self.all_players[pname]={"mmr":pmmr,"roles":[]}
+                    self.all_players[pname]=PlayerRec(pmmr, [])
                 # remove from roles
-                for rname in self.players_by_role:
-                    if pname in self.players_by_role[rname]:
-                        self.players_by_role[rname].remove(pname)
+                self._remove_player(pname)
                 self.teams[tid]["players"].append((pname, role))
+                self._drafted_set.add(pname)
 
         for tid,data in self.teams.items():
+            data["mmr_sum"]=sum(self.all_players[x].mmr for (x,r) in data["players"])
             if data["players"]:
-                mmr_sum=sum(self.all_players[x]["mmr"] for (x,r) in data["players"])
-                data["average_mmr"]= mmr_sum/len(data["players"])
+                data["average_mmr"]= data["mmr_sum"]/len(data["players"])
             else:
                 data["average_mmr"]=0
 
+        # the bump above ran before the CSVs were read; drop anything cached since
+        self._bump_revision()
         print("[LOAD] done")
 
 
@@ -414,6 +609,10 @@ class DraftLogic:
         If you already have this logic in 'compute_probabilities', you can store it
         and return it here or replicate the simple formula.
         """
+        key = ("ideal_mmr", team_id)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+
         team_data = self.teams[team_id]
         current_n = len(team_data["players"])
         team_size = self.config.get("team_size", 5)  # e.g. from YAML
@@ -428,28 +627,33 @@ class DraftLogic:
             return 0.0
 
         ideal_mmr = remaining_mmr / picks_left
+        self._revision_cache[key] = ideal_mmr
         return ideal_mmr
 
     def get_pool_average_mmr(self) -> float:
         """
         Average MMR of all 'undrafted' players.
         """
-        drafted_players = set()
-        for tinfo in self.teams.values():
-            for (pname, _) in tinfo["players"]:
-                drafted_players.add(pname)
+        key = ("pool_average_mmr",)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
 
-        undrafted = [p for p in self.all_players if p not in drafted_players]
+        drafted = self._drafted_set
+        undrafted = [info.mmr for p, info in self.all_players.items() if p not in drafted]
         if not undrafted:
             return 0.0
 
-        total = sum(self.all_players[p]["mmr"] for p in undrafted)
-        return total / len(undrafted)
+        self._revision_cache[key] = sum(undrafted) / len(undrafted)
+        return self._revision_cache[key]
 
     def get_drafted_average_mmr(self) -> float:
         """
         Average MMR of all players currently on teams.
         """
+        key = ("drafted_average_mmr",)
+        if key in self._revision_cache:
+            return self._revision_cache[key]
+
         drafted_list = []
         for tinfo in self.teams.values():
             for (pname, _) in tinfo["players"]:
@@ -458,5 +662,6 @@ class DraftLogic:
         if not drafted_list:
             return 0.0
 
-        total = sum(self.all_players[p]["mmr"] for p in drafted_list)
-        return total / len(drafted_list)
\ No newline at end of file
+        total = sum(self.all_players[p].mmr for p in drafted_list)
+        self._revision_cache[key] = total / len(drafted_list)
+        return self._revision_cache[key]
\ No newline at end of file
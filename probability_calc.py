@@ -1,6 +1,6 @@
 # draft_wheel/probability_calc.py
 import math
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 def logistic_ratio_weight(ratio: float, midpoint: float, slope: float) -> float:
     """
@@ -16,7 +16,7 @@ def logistic_ratio_weight(ratio: float, midpoint: float, slope: float) -> float:
 def compute_probabilities(
     team_data: Dict[str, Any],
     role: str,
-    all_players: Dict[str, Dict[str, Any]],
+    all_players: Dict[str, Any],
     players_in_role: List[str],
     global_average_mmr: float,
     base_randomness: float,
@@ -24,7 +24,9 @@ def compute_probabilities(
     role_preference_weights: Dict[int, float],
     logistic_midpoint: float,
     logistic_slope: float,
-    blend_alpha: float = 0.7
+    blend_alpha: float = 0.7,
+    role_candidates: Optional[Dict[str, Tuple[float, float]]] = None,
+    ideal_mmr: Optional[float] = None
 ) -> Dict[str, float]:
     """
     Compute final probabilities for each available player in `players_in_role`.
@@ -43,7 +45,7 @@ def compute_probabilities(
     role : str
         The role we are drafting for.
     all_players : dict
-        Mapping player_name -> { "mmr": float/int, "roles": [(roleName, priority), ...] }
+        Mapping player_name -> PlayerRec with .mmr and .roles_map = {roleName: priority}
     players_in_role : list
         Which players can play this role (by name).
     global_average_mmr : float
@@ -61,6 +63,12 @@ def compute_probabilities(
     blend_alpha : float
         If 1.0, we multiply (mmr_weight * pref_factor).
         If <1.0, we blend them as alpha*mmr_weight + (1 - alpha)*pref_factor.
+    role_candidates : dict, optional
+        player_name -> (mmr, preference factor) for `role`, as built by build_role_index.
+        Players missing from it are skipped; computed from `all_players` when omitted.
+    ideal_mmr : float, optional
+        The ideal MMR for this team's next pick, if the caller already has it.
+        Computed from `team_data` when omitted.
 
     Returns:
     --------
@@ -69,86 +77,144 @@ def compute_probabilities(
 
     # Number of players already in the team
     current_n = len(team_data["players"])
-    # Current total MMR (approx)
-    current_sum = team_data["average_mmr"] * current_n
 
     # How many picks remain for this team
     picks_left = team_size - current_n
     if picks_left <= 0:
         return {}
 
-    # Total MMR we want for a 'balanced' final team
-    desired_total_for_full_team = team_size * global_average_mmr
+    if ideal_mmr is None:
+        # Current total MMR (approx)
+        current_sum = team_data["average_mmr"] * current_n
 
-    # MMR budget for the remaining picks
-    remaining_mmr = desired_total_for_full_team - current_sum
+        # Total MMR we want for a 'balanced' final team
+        desired_total_for_full_team = team_size * global_average_mmr
 
-    # Ideal MMR for *this next pick* if we want to stay on track
-    ideal_mmr = remaining_mmr / picks_left
+        # MMR budget for the remaining picks
+        remaining_mmr = desired_total_for_full_team - current_sum
 
-    raw_weights = {}
-    for player_name in players_in_role:
-        info = all_players[player_name]
-        pmmr = info["mmr"]
+        # Ideal MMR for *this next pick* if we want to stay on track
+        ideal_mmr = remaining_mmr / picks_left
+
+    if role_candidates is None:
+        # Get how strongly each player wants this role (1st/2nd/3rd preference)
+        role_candidates = {}
+        for player_name in players_in_role:
+            info = all_players[player_name]
+            pref_factor = get_role_preference_factor(info, role, role_preference_weights)
+            if pref_factor > 0:
+                role_candidates[player_name] = (info.mmr, pref_factor)
 
-        # Get how strongly the player wants this role (1st/2nd/3rd preference)
-        pref_factor = get_role_preference_factor(info, role, role_preference_weights)
-        if pref_factor <= 0:
+    # Pack the candidates who want this role into parallel lists
+    names = []
+    mmrs = []
+    prefs = []
+    for player_name in players_in_role:
+        candidate = role_candidates.get(player_name)
+        if candidate is None:
             # skip if not in top preferences
             continue
 
-        # Calculate ratio: how far off from ideal, relative to ideal
-        diff = abs(pmmr - ideal_mmr)
-        if ideal_mmr <= 0:
-            # fallback if something is off or ideal_mmr is zero
-            ratio = 99999.0
-        else:
-            ratio = diff / ideal_mmr
-
-        # Convert ratio to [0..1] with logistic
-        mmr_weight = logistic_ratio_weight(ratio, logistic_midpoint, logistic_slope)
-
-        # Combine with role preference factor
-        if abs(blend_alpha - 1.0) < 1e-8:
-            final_w = mmr_weight * pref_factor
-        else:
-            # Weighted blend approach
-            final_w = blend_alpha * mmr_weight + (1 - blend_alpha) * pref_factor
-
-        raw_weights[player_name] = final_w
+        names.append(player_name)
+        mmrs.append(candidate[0])
+        prefs.append(candidate[1])
 
     # If no valid players remain
-    if not raw_weights:
+    if not names:
         return {}
 
+    # Weights stay a list parallel to names; the result dict is built once at the end
+    weights = _combined_weights(
+        mmrs, prefs, ideal_mmr, logistic_midpoint, logistic_slope, blend_alpha
+    )
+
     # Sum up all weights
-    total_w = sum(raw_weights.values())
+    total_w = sum(weights)
     if total_w <= 0:
         # fallback to uniform distribution
-        N = len(raw_weights)
-        return {p: 1.0 / N for p in raw_weights}
+        return dict.fromkeys(names, 1.0 / len(names))
 
     # Convert raw weights into probabilities
-    N = len(raw_weights)
-    final_probs = {}
-    for p, w in raw_weights.items():
+    N = len(names)
+    # Uniform portion
+    uniform_portion = base_randomness / N
+    final_probs = []
+    # running total, so the normalization check needs no second pass
+    s = 0.0
+    for w in weights:
         # Weighted portion relative to total
         mmr_portion = (w / total_w) * (1 - base_randomness)
-        # Uniform portion
-        uniform_portion = base_randomness / N
-        final_probs[p] = mmr_portion + uniform_portion
+        prob = mmr_portion + uniform_portion
+        final_probs.append(prob)
+        s += prob
 
     # Minor normalization pass
-    s = sum(final_probs.values())
     if abs(s - 1.0) > 1e-8:
-        for k in final_probs:
-            final_probs[k] /= s
+        final_probs = [v / s for v in final_probs]
 
-    return final_probs
+    return dict(zip(names, final_probs))
+
+
+def _combined_weights(
+    mmrs: List[float],
+    prefs: List[float],
+    ideal_mmr: float,
+    midpoint: float,
+    slope: float,
+    blend_alpha: float
+) -> List[float]:
+    """
+    Numeric core of compute_probabilities: the combined MMR/preference weight
+    for each candidate, given parallel lists of MMRs and preference factors.
+    Works on plain numbers only, with no dict lookups or per-player branches.
+    """
+    if not mmrs:
+        return []
+    weight = logistic_ratio_weight
+
+    # ideal_mmr and blend_alpha are fixed for the call, so both branches are taken once
+    if ideal_mmr <= 0:
+        # fallback if something is off or ideal_mmr is zero: every ratio is 99999
+        mmr_weights = [weight(99999.0, midpoint, slope)] * len(mmrs)
+    else:
+        # ratio = how far off from ideal, relative to ideal; logistic maps it to [0..1]
+        mmr_weights = [
+            weight(abs(pmmr - ideal_mmr) / ideal_mmr, midpoint, slope)
+            for pmmr in mmrs
+        ]
+
+    # Combine with role preference factor
+    if abs(blend_alpha - 1.0) < 1e-8:
+        return [mmr_weight * pref_factor for mmr_weight, pref_factor in zip(mmr_weights, prefs)]
+
+    # Weighted blend approach
+    pref_alpha = 1 - blend_alpha
+    return [
+        blend_alpha * mmr_weight + pref_alpha * pref_factor
+        for mmr_weight, pref_factor in zip(mmr_weights, prefs)
+    ]
+
+
+def build_role_index(
+    all_players: Dict[str, Any],
+    preference_weights: Dict[int, float]
+) -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """
+    role -> {player_name: (mmr, preference factor)}, keeping only players whose
+    factor for that role is above zero. Built once per player pool, so each pick
+    reads a candidate's numbers from one tuple instead of re-deriving them.
+    """
+    index: Dict[str, Dict[str, Tuple[float, float]]] = {}
+    for player_name, info in all_players.items():
+        for rname, prio in info.roles_map.items():
+            pref_factor = preference_weights.get(prio, 0.0)
+            if pref_factor > 0:
+                index.setdefault(rname, {})[player_name] = (info.mmr, pref_factor)
+    return index
 
 
 def get_role_preference_factor(
-    player_info: Dict[str, Any],
+    player_info: Any,
     role: str,
     preference_weights: Dict[int, float]
 ) -> float:
@@ -157,8 +223,8 @@ def get_role_preference_factor(
     E.g. preference_weights = {1: 0.9, 2: 0.6, 3: 0.1}
     Returns 0.0 if the role isn't found or is out of top 3 priorities.
     """
-    roles_list = player_info.get("roles", [])
-    for (rname, prio) in roles_list:
-        if rname == role:
-            return preference_weights.get(prio, 0.0)
-    return 0.0
+    # roles_map is the player's {roleName: priority}, so this is a hash lookup, not a scan
+    prio = player_info.roles_map.get(role)
+    if prio is None:
+        return 0.0
+    return preference_weights.get(prio, 0.0)
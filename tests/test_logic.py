@@ -0,0 +1,166 @@
+# draft_wheel/tests/test_logic.py
+import math
+import os
+import tempfile
+import unittest
+
+from logic.draft_logic import DraftLogic
+from probability_calc import _combined_weights, logistic_ratio_weight
+
+PLAYERS_CSV = """name,mmr,roles
+alpha,7200,carry(1)|mid(2)
+bravo,6100,mid(1)|offlane(2)
+charlie,5400,offlane(1)|carry(3)
+delta,4800,soft_support(1)|hard_support(2)
+echo,3900,hard_support(1)|soft_support(2)
+foxtrot,6600,carry(1)|offlane(2)|mid(3)
+golf,5000,mid(1)|soft_support(3)
+"""
+
+
+def make_config(player_csv):
+    return {
+        "global_average_mmr": 5500,
+        "team_size": 5,
+        "player_data_csv": player_csv,
+        "default_teams": ["red", "blue"],
+        "roles": ["carry", "mid", "offlane", "soft_support", "hard_support"],
+        "randomness_levels": {0: 0.30, 1: 0.10, 2: 0.05, 3: 0.02, 4: 0.01},
+        "role_preference_weights": {1: 0.9, 2: 0.7, 3: 0.25},
+        "logistic_settings": {"midpoint": 0.3, "slope": 20.0, "blend_alpha": 0.7},
+    }
+
+
+def segments_for(probs):
+    """Wheel segments [(player, start, end)] in the order of probs"""
+    segments = []
+    start = 0.0
+    for name, prob in probs.items():
+        segments.append((name, start, start + prob))
+        start += prob
+    return segments
+
+
+class DraftLogicCacheTest(unittest.TestCase):
+    """Values cached per draft revision must follow picks, undos and loads"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.players_csv = os.path.join(self.tmpdir.name, "players.csv")
+        with open(self.players_csv, "w", encoding="utf-8") as f:
+            f.write(PLAYERS_CSV)
+        self.logic = DraftLogic(make_config(self.players_csv))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def pick(self, team_id, role, name):
+        """Pick the named player by landing in the middle of their segment"""
+        segments = segments_for(self.logic.compute_probabilities(team_id, role))
+        for p, start, end in segments:
+            if p == name:
+                return self.logic.pick_player_from_position(team_id, role, (start + end) / 2, segments)
+        self.fail(f"{name} is not a candidate for {role}")
+
+    def test_pick_invalidates_cached_values(self):
+        logic = self.logic
+        probs_before = logic.compute_probabilities("red", "carry")
+        ideal_before = logic.get_ideal_mmr_for_pick("red", "carry")
+        pool_before = logic.get_pool_average_mmr()
+        buckets_before = logic.get_mmr_bucket_stats()
+        self.assertIn("alpha", probs_before)
+
+        revision = logic.revision
+        self.assertEqual(self.pick("red", "carry", "alpha"), "alpha")
+        self.assertGreater(logic.revision, revision)
+
+        self.assertNotIn("alpha", logic.compute_probabilities("blue", "carry"))
+        self.assertNotIn("alpha", logic.compute_probabilities("red", "mid"))
+        self.assertNotEqual(logic.get_ideal_mmr_for_pick("red", "mid"), ideal_before)
+        self.assertNotEqual(logic.get_pool_average_mmr(), pool_before)
+        self.assertNotEqual(logic.get_mmr_bucket_stats(), buckets_before)
+        self.assertEqual(logic.teams["red"]["players"], [("alpha", "carry")])
+
+    def test_undo_restores_cached_values(self):
+        logic = self.logic
+        probs_before = dict(logic.compute_probabilities("red", "carry"))
+        pool_before = logic.get_pool_average_mmr()
+        dist_before = dict(logic.get_role_distribution_stats())
+        counts_before = logic.get_role_priority_counts()
+
+        self.pick("red", "carry", "alpha")
+        self.assertNotEqual(logic.get_role_priority_counts(), counts_before)
+        self.assertEqual(logic.undo_last_pick(), "alpha")
+
+        self.assertEqual(logic.compute_probabilities("red", "carry"), probs_before)
+        self.assertEqual(logic.get_pool_average_mmr(), pool_before)
+        self.assertEqual(logic.get_role_distribution_stats(), dist_before)
+        self.assertEqual(logic.get_role_priority_counts(), counts_before)
+        self.assertEqual(logic.teams["red"]["players"], [])
+
+    def test_load_state_invalidates_cached_values(self):
+        logic = self.logic
+        self.pick("red", "carry", "alpha")
+        self.pick("blue", "mid", "bravo")
+        remaining_csv = os.path.join(self.tmpdir.name, "remaining.csv")
+        teams_csv = os.path.join(self.tmpdir.name, "teams.csv")
+        logic.save_state(remaining_csv, teams_csv)
+        saved_probs = dict(logic.compute_probabilities("red", "mid"))
+        saved_pool = logic.get_pool_average_mmr()
+
+        # Undo both picks so every cached value is computed for the un-drafted pool
+        logic.undo_last_pick()
+        logic.undo_last_pick()
+        self.assertNotEqual(logic.compute_probabilities("red", "mid"), saved_probs)
+        self.assertNotEqual(logic.get_pool_average_mmr(), saved_pool)
+
+        logic.load_state(remaining_csv, teams_csv)
+        self.assertEqual(logic.compute_probabilities("red", "mid"), saved_probs)
+        self.assertEqual(logic.get_pool_average_mmr(), saved_pool)
+        self.assertEqual(logic.teams["red"]["players"], [("alpha", "carry")])
+
+    def test_reload_with_repeated_name_uses_last_row(self):
+        with open(self.players_csv, "a", encoding="utf-8") as f:
+            f.write("alpha,7300,mid(1)\n")
+        self.logic.load_player_data()
+        by_role = self.logic.get_players_by_role()
+        self.assertNotIn("alpha", by_role["carry"])
+        self.assertIn("alpha", by_role["mid"])
+        self.assertEqual(self.logic.all_players["alpha"].mmr, 7300)
+
+
+class CombinedWeightsTest(unittest.TestCase):
+    """The probability kernel must follow logistic_ratio_weight"""
+
+    MMRS = [3900, 4800, 5000, 5400, 6100, 6600, 7200]
+    PREFS = [0.9, 0.7, 0.25, 0.9, 0.7, 0.9, 0.25]
+
+    def expected(self, ideal_mmr, midpoint, slope, blend_alpha):
+        weights = []
+        for mmr, pref in zip(self.MMRS, self.PREFS):
+            ratio = abs(mmr - ideal_mmr) / ideal_mmr
+            mmr_weight = logistic_ratio_weight(ratio, midpoint, slope)
+            if abs(blend_alpha - 1.0) < 1e-8:
+                weights.append(mmr_weight * pref)
+            else:
+                weights.append(blend_alpha * mmr_weight + (1 - blend_alpha) * pref)
+        return weights
+
+    def test_matches_logistic_ratio_weight(self):
+        for ideal_mmr in (3000.0, 5500.0, 8000.0):
+            for blend_alpha in (1.0, 0.7, 0.0):
+                with self.subTest(ideal_mmr=ideal_mmr, blend_alpha=blend_alpha):
+                    self.assertEqual(
+                        _combined_weights(self.MMRS, self.PREFS, ideal_mmr, 0.3, 20.0, blend_alpha),
+                        self.expected(ideal_mmr, 0.3, 20.0, blend_alpha)
+                    )
+
+    def test_logistic_midpoint_is_half(self):
+        self.assertTrue(math.isclose(logistic_ratio_weight(0.3, 0.3, 20.0), 0.5))
+
+    def test_empty_candidates(self):
+        self.assertEqual(_combined_weights([], [], 5500.0, 0.3, 20.0, 0.7), [])
+
+
+if __name__ == "__main__":
+    unittest.main()